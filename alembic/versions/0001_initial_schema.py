@@ -0,0 +1,99 @@
+"""initial schema
+
+The tables exactly as the old create_all() start-up built them, so a
+database from before Alembic can be stamped at this revision.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("is_superuser", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
+    op.create_index(op.f("ix_users_username"), "users", ["username"], unique=True)
+
+    op.create_table(
+        "profiles",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("naukri_username", sa.String(), nullable=True),
+        sa.Column("naukri_password", sa.String(), nullable=True),
+        sa.Column("keywords", sa.String(), nullable=True),
+        sa.Column("locations", sa.String(), nullable=True),
+        sa.Column("notice_period", sa.String(), nullable=True),
+        sa.Column("ctc", sa.String(), nullable=True),
+        sa.Column("resume_path", sa.String(), nullable=True),
+        sa.Column("blacklisted_companies", sa.String(), nullable=True),
+        sa.Column("blacklisted_keywords", sa.String(), nullable=True),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_profiles_id"), "profiles", ["id"], unique=False)
+    op.create_index(op.f("ix_profiles_naukri_username"), "profiles", ["naukri_username"], unique=False)
+
+    op.create_table(
+        "applied_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("job_title", sa.String(), nullable=True),
+        sa.Column("company_name", sa.String(), nullable=True),
+        sa.Column("job_link", sa.String(), nullable=True),
+        sa.Column("applied_date", sa.DateTime(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_applied_jobs_company_name"), "applied_jobs", ["company_name"], unique=False)
+    op.create_index(op.f("ix_applied_jobs_id"), "applied_jobs", ["id"], unique=False)
+    op.create_index(op.f("ix_applied_jobs_job_title"), "applied_jobs", ["job_title"], unique=False)
+
+    op.create_table(
+        "recommended_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("job_title", sa.String(), nullable=True),
+        sa.Column("company_name", sa.String(), nullable=True),
+        sa.Column("job_link", sa.String(), nullable=True),
+        sa.Column("matched_keyword", sa.String(), nullable=True),
+        sa.Column("recommended_date", sa.DateTime(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_link"),
+    )
+    op.create_index(op.f("ix_recommended_jobs_company_name"), "recommended_jobs", ["company_name"], unique=False)
+    op.create_index(op.f("ix_recommended_jobs_id"), "recommended_jobs", ["id"], unique=False)
+    op.create_index(op.f("ix_recommended_jobs_job_title"), "recommended_jobs", ["job_title"], unique=False)
+    op.create_index(op.f("ix_recommended_jobs_matched_keyword"), "recommended_jobs", ["matched_keyword"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("recommended_jobs")
+    op.drop_table("applied_jobs")
+    op.drop_table("profiles")
+    op.drop_index(op.f("ix_users_username"), table_name="users")
+    op.drop_index(op.f("ix_users_id"), table_name="users")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.drop_table("users")
@@ -0,0 +1,72 @@
+"""per-user job links, keyset indexes and profile versions
+
+Job links become unique per user instead of globally on recommended_jobs,
+history pages get (user_id, date, id) indexes and profiles get the version
+counter the profile cache is keyed on. Duplicate rows are removed first,
+keeping the oldest, or the unique indexes could not be built.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Names the unnamed UNIQUE(job_link) from 0001 so batch mode can drop it on SQLite.
+_NAMING_CONVENTION = {"uq": "uq_%(table_name)s_%(column_0_name)s"}
+
+
+def _delete_duplicate_links(table: str) -> None:
+    op.execute(
+        f"DELETE FROM {table} WHERE job_link IS NOT NULL AND id NOT IN "
+        f"(SELECT keep_id FROM (SELECT MIN(id) AS keep_id FROM {table} GROUP BY user_id, job_link) AS keep)"
+    )
+
+
+def _job_link_unique_name() -> str:
+    for constraint in sa.inspect(op.get_bind()).get_unique_constraints("recommended_jobs"):
+        if constraint["column_names"] == ["job_link"] and constraint["name"]:
+            return constraint["name"]
+    return "uq_recommended_jobs_job_link"
+
+
+def upgrade() -> None:
+    _delete_duplicate_links("applied_jobs")
+    _delete_duplicate_links("recommended_jobs")
+
+    with op.batch_alter_table("profiles") as batch_op:
+        batch_op.add_column(sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+
+    with op.batch_alter_table("recommended_jobs", naming_convention=_NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(_job_link_unique_name(), type_="unique")
+
+    op.create_index("ix_applied_jobs_user_link", "applied_jobs", ["user_id", "job_link"], unique=True)
+    op.create_index("ix_applied_jobs_user_date_id", "applied_jobs", ["user_id", "applied_date", "id"], unique=False)
+    op.create_index("ix_recommended_jobs_user_link", "recommended_jobs", ["user_id", "job_link"], unique=True)
+    op.create_index("ix_recommended_jobs_user_date_id", "recommended_jobs", ["user_id", "recommended_date", "id"], unique=False)
+    op.create_index("ix_recommended_jobs_user_keyword", "recommended_jobs", ["user_id", "matched_keyword"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recommended_jobs_user_keyword", table_name="recommended_jobs")
+    op.drop_index("ix_recommended_jobs_user_date_id", table_name="recommended_jobs")
+    op.drop_index("ix_recommended_jobs_user_link", table_name="recommended_jobs")
+    op.drop_index("ix_applied_jobs_user_date_id", table_name="applied_jobs")
+    op.drop_index("ix_applied_jobs_user_link", table_name="applied_jobs")
+
+    # Fails if two users have since been recommended the same link.
+    with op.batch_alter_table("recommended_jobs", naming_convention=_NAMING_CONVENTION) as batch_op:
+        batch_op.create_unique_constraint("uq_recommended_jobs_job_link", ["job_link"])
+
+    with op.batch_alter_table("profiles") as batch_op:
+        batch_op.drop_column("version")
@@ -6,8 +6,9 @@ from pydantic import ValidationError
 
 # Import all the necessary components from our redesigned structure
 from ..db.database import get_db
-from ..db import models, schemas, crud
+from ..db import schemas, crud
 from ..core.config import settings
+from .token_cache import UserSnapshot, token_cache
 
 # This tells FastAPI how to find the token in requests.
 # The tokenUrl points to the login endpoint in our auth router.
@@ -17,7 +18,14 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     """
     Decodes the JWT token from the request to get the current user.
     This is the primary dependency for user authentication.
+
+    Verified tokens are cached (see token_cache), so in the common case this
+    returns a UserSnapshot without decoding the token or querying the DB.
     """
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -38,9 +46,11 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     user = crud.get_user_by_username(db, username=token_data.username)
     if user is None:
         raise credentials_exception
-    return user
+    snapshot = UserSnapshot.from_user(user)
+    token_cache.put(token, snapshot, token_expires_at=payload.get("exp"))
+    return snapshot
 
-def get_current_active_user(current_user: models.User = Depends(get_current_user)):
+def get_current_active_user(current_user: UserSnapshot = Depends(get_current_user)):
     """
     A dependency that builds on get_current_user to also check if the user is active.
     """
@@ -48,7 +58,7 @@ def get_current_active_user(current_user: models.User = Depends(get_current_user
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
     return current_user
 
-def get_current_admin_user(current_user: models.User = Depends(get_current_active_user)):
+def get_current_admin_user(current_user: UserSnapshot = Depends(get_current_active_user)):
     """
     A dependency to protect admin-only routes. It checks if the user is a superuser.
     """
@@ -1,8 +1,51 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
 from passlib.context import CryptContext
 
+from ..core.config import settings
+
 # Set up the password hashing context, specifying bcrypt as the scheme.
 # This is a standard and secure way to handle password hashing.
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# The cost factor comes from settings; pinning min and max to it makes
+# `needs_update` flag hashes made with any other cost so they get rehashed.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+
+class HashingBusyError(RuntimeError):
+    """Raised when too many hashing jobs are already running or queued."""
+
+
+# bcrypt releases the GIL, so a small dedicated thread pool runs hashes in
+# parallel without tying up the request threads. The semaphore caps running
+# plus queued jobs; beyond that we fail fast instead of queueing forever.
+# The auth routes await the *_async helpers, so queued jobs never hold one
+# of the API's request threads.
+_workers = settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+_executor = ThreadPoolExecutor(max_workers=_workers, thread_name_prefix="password-hash")
+_slots = threading.BoundedSemaphore(_workers + settings.PASSWORD_HASH_MAX_QUEUE)
+
+
+def _submit(fn, *args):
+    if not _slots.acquire(blocking=False):
+        raise HashingBusyError("Too many password hashing requests in progress")
+    try:
+        future = _executor.submit(fn, *args)
+    except BaseException:
+        _slots.release()
+        raise
+    future.add_done_callback(lambda _: _slots.release())
+    return future
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -15,16 +58,26 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if the passwords match, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return _submit(pwd_context.verify, plain_password, hashed_password).result()
 
-def hash_password(password: str) -> str:
+async def verify_and_update_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verifies a password and, if the stored hash uses an outdated cost
+    factor, returns a fresh hash to store in its place.
+
+    Returns:
+        (matches, new_hash) where new_hash is None if no upgrade is needed.
+    """
+    return await asyncio.wrap_future(_submit(pwd_context.verify_and_update, plain_password, hashed_password))
+
+async def hash_password_async(password: str) -> str:
     """
     Hashes a plain-text password using the bcrypt algorithm.
-    
+
     Args:
         password: The plain-text password to hash.
-        
+
     Returns:
         The hashed password string.
     """
-    return pwd_context.hash(password)
+    return await asyncio.wrap_future(_submit(pwd_context.hash, password))
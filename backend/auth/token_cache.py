@@ -0,0 +1,170 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import redis
+
+from ..core.config import settings
+from ..core.metrics import TOKEN_CACHE_INVALIDATIONS, TOKEN_CACHE_LOOKUPS
+from ..core.redis_client import get_redis
+
+
+def _version_key(user_id: int) -> str:
+    return f"auth:user-version:{user_id}"
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """The fields authenticated endpoints need, detached from any DB session."""
+    id: int
+    username: str
+    email: str
+    is_active: bool
+    is_superuser: bool
+
+    @classmethod
+    def from_user(cls, user) -> "UserSnapshot":
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=bool(user.is_active),
+            is_superuser=bool(user.is_superuser),
+        )
+
+
+class TokenCache:
+    """
+    Bounded TTL cache of verified access token -> UserSnapshot, so repeated
+    requests with the same token skip both the JWT decode and the user query.
+
+    An entry never outlives its token's `exp`. `invalidate_user` drops a
+    user's entries here and bumps the user's version key in Redis; every
+    entry remembers the version it was cached under and a hit is only served
+    while that is still current. Versions read from Redis are trusted for
+    `version_check_seconds`, so a hit rarely costs a round trip and other
+    API processes stop using stale entries within that time. If Redis
+    cannot be reached, nothing is served from the cache (and Redis is not
+    asked again for `version_check_seconds`).
+
+    Lookups and invalidations are exported as Prometheus counters.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.TOKEN_CACHE_TTL_SECONDS,
+        max_entries: int = settings.TOKEN_CACHE_MAX_ENTRIES,
+        version_check_seconds: float = settings.TOKEN_CACHE_VERSION_CHECK_SECONDS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.version_check_seconds = version_check_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        # user id -> (monotonic time read, version)
+        self._versions: OrderedDict = OrderedDict()
+        self._redis_failed_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _user_version(self, user_id: int) -> Optional[str]:
+        """
+        The user's current version, read from Redis at most every
+        `version_check_seconds`; None while Redis is unavailable.
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._versions.get(user_id)
+            if cached is not None and now - cached[0] < self.version_check_seconds:
+                return cached[1]
+            if self._redis_failed_at is not None and now - self._redis_failed_at < self.version_check_seconds:
+                return None
+        try:
+            version = get_redis().get(_version_key(user_id)) or "0"
+        except redis.RedisError as e:
+            with self._lock:
+                if self._redis_failed_at is None:
+                    print(f"WARNING: Token cache cannot reach Redis, serving no cached tokens until it is back: {e}")
+                self._redis_failed_at = now
+            return None
+        with self._lock:
+            if self._redis_failed_at is not None:
+                print("INFO: Token cache reached Redis again.")
+                self._redis_failed_at = None
+            self._versions[user_id] = (now, version)
+            self._versions.move_to_end(user_id)
+            while len(self._versions) > self.max_entries:
+                self._versions.popitem(last=False)
+        return version
+
+    def get(self, token: str) -> Optional[UserSnapshot]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[key]
+                entry = None
+        # Checked outside the lock, so other requests never wait on Redis.
+        if entry is not None and self._user_version(entry[1].id) == entry[2]:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self.hits += 1
+            TOKEN_CACHE_LOOKUPS.labels(result="hit").inc()
+            return entry[1]
+        with self._lock:
+            if entry is not None and self._entries.get(key) is entry:
+                del self._entries[key]
+            self.misses += 1
+        TOKEN_CACHE_LOOKUPS.labels(result="miss").inc()
+        return None
+
+    def put(self, token: str, snapshot: UserSnapshot, token_expires_at: Optional[float] = None):
+        version = self._user_version(snapshot.id)
+        if version is None:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+        with self._lock:
+            self._entries[self._key(token)] = (expires_at, snapshot, version)
+            self._entries.move_to_end(self._key(token))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int):
+        with self._lock:
+            stale = [key for key, (_, snapshot, _) in self._entries.items() if snapshot.id == user_id]
+            for key in stale:
+                del self._entries[key]
+            self._versions.pop(user_id, None)
+        TOKEN_CACHE_INVALIDATIONS.inc()
+        try:
+            pipe = get_redis().pipeline()
+            pipe.incr(_version_key(user_id))
+            # Outlives every entry cached under an older version.
+            pipe.expire(_version_key(user_id), 2 * self.ttl_seconds)
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"WARNING: Token cache could not publish the new version of user {user_id}: {e}. "
+                  f"Other processes drop it within {self.ttl_seconds}s.")
+            with self._lock:
+                self._redis_failed_at = time.monotonic()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+token_cache = TokenCache()
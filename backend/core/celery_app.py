@@ -1,10 +1,74 @@
+import time
+
 from celery import Celery
+from celery.signals import task_postrun, task_prerun, worker_init, worker_process_init, worker_process_shutdown
 from .config import settings
 
 celery_app = Celery(
     "tasks",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    include=["backend.tasks.run_bot_task", "backend.tasks.weekly_report"]
+    include=["backend.tasks.run_bot_task", "backend.tasks.weekly_report", "backend.tasks.daily_scan"]
+)
+celery_app.conf.update(
+    task_track_started=True,
+    task_always_eager=settings.CELERY_TASK_ALWAYS_EAGER,
+    # Bot runs are long and hold a browser: take one task at a time, and only
+    # ack it once it has finished so a crashed worker's run is redelivered.
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+    task_time_limit=settings.BOT_TASK_TIME_LIMIT_SECONDS,
+    task_soft_time_limit=settings.BOT_TASK_TIME_LIMIT_SECONDS - 60,
+    # Must exceed the longest run, or Redis redelivers tasks still running.
+    broker_transport_options={"visibility_timeout": settings.BOT_TASK_TIME_LIMIT_SECONDS + 600},
+    # Daily scan shards go to their own queue, so the number of shards
+    # running at once is bounded by that queue's worker concurrency.
+    task_routes={"backend.tasks.daily_scan.scan_user_shard": {"queue": "scan"}},
 )
-celery_app.conf.update(task_track_started=True)
+
+
+@worker_process_init.connect
+def _reset_db_pool(**kwargs):
+    # Connections opened before the prefork must not be shared with children.
+    from ..db.database import engine
+    engine.dispose(close=False)
+
+
+@worker_process_init.connect
+def _start_bot_loop(**kwargs):
+    # Each worker process keeps one event loop and one browser pool for all
+    # the bot tasks it runs, instead of a fresh loop and Chromium per task.
+    from bot_engine.worker_loop import start_worker_loop
+    start_worker_loop()
+
+
+@worker_process_shutdown.connect
+def _stop_bot_loop(**kwargs):
+    from bot_engine.worker_loop import stop_worker_loop
+    stop_worker_loop()
+
+
+@worker_init.connect
+def _start_metrics_exporter(**kwargs):
+    # Runs once in the main worker process; with prefork set
+    # PROMETHEUS_MULTIPROC_DIR so it serves the children's metrics too.
+    if settings.WORKER_METRICS_PORT:
+        from .metrics import start_metrics_server
+        start_metrics_server(settings.WORKER_METRICS_PORT)
+
+
+_task_started_at = {}
+
+
+@task_prerun.connect
+def _record_task_start(task_id=None, **kwargs):
+    _task_started_at[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _record_task_duration(task_id=None, task=None, state=None, **kwargs):
+    started_at = _task_started_at.pop(task_id, None)
+    if started_at is not None:
+        from .metrics import CELERY_TASK_SECONDS
+        CELERY_TASK_SECONDS.labels(task=task.name, state=state or "UNKNOWN").observe(time.perf_counter() - started_at)
@@ -1,3 +1,4 @@
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -6,10 +7,97 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
     DATABASE_URL: str = "sqlite:///./naukri_bot.db"
+    # Async form of DATABASE_URL for the API; derived (aiosqlite/asyncpg) when unset.
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # Connection pools: server databases (Postgres) and file-backed SQLite.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    SQLITE_POOL_SIZE: int = 5
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE_MB: int = 256
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL"] = "NORMAL"
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/0"
+    CELERY_TASK_ALWAYS_EAGER: bool = False
+    REDIS_URL: str = "redis://localhost:6379/0"
     FIRST_ADMIN_USER: str = "admin"
     FIRST_ADMIN_PASSWORD: str = "adminpassword"
     FIRST_ADMIN_EMAIL: str = "admin@example.com"
+    # Outgoing email (weekly reports)
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 1025
+    SMTP_USERNAME: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_USE_TLS: bool = False
+    SMTP_FROM: str = "Naukri Bot <noreply@example.com>"
+    # Password hashing: bcrypt cost factor, dedicated worker threads
+    # (0 = one per CPU) and how many extra requests may wait for a worker.
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    TOKEN_CACHE_TTL_SECONDS: int = 60
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    # How long a process trusts its last read of a user's version key.
+    TOKEN_CACHE_VERSION_CHECK_SECONDS: float = 2.0
+
+    # Bot engine
+    NAUKRI_BASE_URL: str = "https://www.naukri.com"
+    BROWSER_HEADLESS: bool = True
+    BROWSER_POOL_SIZE: int = 2
+    BROWSER_MAX_CONTEXTS: int = 50
+    BROWSER_MAX_RSS_MB: int = 2048
+    # Reading the browsers' memory walks /proc; do it at most this often.
+    BROWSER_RSS_SAMPLE_SECONDS: float = 5.0
+    BOT_MAX_CONCURRENT_USERS: int = 8
+    BOT_MAX_CONCURRENT_PER_DOMAIN: int = 4
+    BOT_APPLY_TABS: int = 3
+    SCAN_MAX_PAGES: int = 5
+    # Celery bot task: hard time limit, retries on transient browser errors
+    # and the cluster-wide cap on outbound applications.
+    BOT_TASK_TIME_LIMIT_SECONDS: int = 3600
+    BOT_TASK_MAX_RETRIES: int = 3
+    BOT_TASK_RETRY_BACKOFF_SECONDS: int = 60
+    BOT_APPLICATIONS_PER_MINUTE: int = 60
+    # Run status and progress events (kept in Redis after a run ends).
+    RUN_STATE_TTL_SECONDS: int = 86400
+    RUN_EVENTS_KEEPALIVE_SECONDS: float = 15.0
+    RUN_CANCEL_CHECK_SECONDS: float = 1.0
+    # Port of the Celery worker's Prometheus exporter (0 disables it).
+    WORKER_METRICS_PORT: int = 9808
+    # Recommendation scoring: minimum score, matches kept per user, score
+    # factor for jobs outside the user's locations, and the longest notice
+    # period that still suits "immediate joiner" jobs.
+    RECOMMEND_MIN_SCORE: float = 0.2
+    RECOMMEND_TOP_K: int = 20
+    RECOMMEND_OTHER_LOCATION_FACTOR: float = 0.0
+    RECOMMEND_IMMEDIATE_NOTICE_DAYS: int = 15
+    # Daily scan fan-out
+    DAILY_SCAN_HOUR: int = 7
+    DAILY_SCAN_MINUTE: int = 30
+    DAILY_SCAN_SHARD_SIZE: int = 25
+    DAILY_SCAN_MAX_PARALLEL_SHARDS: int = 4
+    DAILY_SCAN_WAVE_SECONDS: int = 300
+    DAILY_SCAN_JITTER_SECONDS: int = 240
+    SCAN_CACHE_TTL_SECONDS: int = 900
+    SCAN_CACHE_MAX_ENTRIES: int = 5000
+    PROFILE_CACHE_TTL_SECONDS: int = 86400
+    BLACKLIST_WORD_BOUNDARY: bool = True
+    # Write-behind buffer for bot results
+    WRITER_BATCH_SIZE: int = 200
+    WRITER_FLUSH_INTERVAL_SECONDS: float = 2.0
+    WRITER_MAX_PENDING: int = 5000
+    # A failed batch is retried with doubling waits, then written row by row.
+    WRITER_MAX_RETRIES: int = 3
+    WRITER_RETRY_BACKOFF_SECONDS: float = 0.5
+    # Upper bounds for readiness waits; steps finish as soon as the page is ready.
+    BOT_READY_TIMEOUT_MS: int = 15000
+    BOT_LOGIN_TIMEOUT_MS: int = 20000
+    BOT_APPLY_TIMEOUT_MS: int = 10000
+    # Encrypted cache of logged-in Naukri sessions. The key defaults to one
+    # derived from SECRET_KEY; set a Fernet key here to rotate it separately.
+    SESSION_CACHE_DIR: str = "./.naukri_sessions"
+    SESSION_CACHE_KEY: Optional[str] = None
 
 settings = Settings()
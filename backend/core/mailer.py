@@ -0,0 +1,67 @@
+import smtplib
+from email.message import EmailMessage
+from typing import Optional
+
+from .config import settings
+
+
+class SMTPMailer:
+    """
+    Sends many emails over one SMTP connection instead of a handshake (and
+    login) per message. Use as a context manager:
+
+        with SMTPMailer() as mailer:
+            mailer.send(to, subject, html)
+
+    For local testing point SMTP_HOST/SMTP_PORT at a debugging server, e.g.
+    `python -m aiosmtpd -n -l localhost:1025`.
+    """
+
+    def __init__(self, host: str = settings.SMTP_HOST, port: int = settings.SMTP_PORT,
+                 username: Optional[str] = settings.SMTP_USERNAME, password: Optional[str] = settings.SMTP_PASSWORD,
+                 use_tls: bool = settings.SMTP_USE_TLS, sender: str = settings.SMTP_FROM):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.sender = sender
+        self.sent = 0
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def __enter__(self):
+        self._connect()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _connect(self):
+        self._smtp = smtplib.SMTP(self.host, self.port, timeout=30)
+        if self.use_tls:
+            self._smtp.starttls()
+        if self.username:
+            self._smtp.login(self.username, self.password or "")
+
+    def send(self, to: str, subject: str, html: str):
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = to
+        message["Subject"] = subject
+        message.set_content("This report is best viewed in an HTML email client.")
+        message.add_alternative(html, subtype="html")
+        try:
+            self._smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # The server may drop long-lived connections; reconnect once.
+            self._connect()
+            self._smtp.send_message(message)
+        self.sent += 1
+
+    def close(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
@@ -0,0 +1,76 @@
+"""
+Prometheus metrics shared by the API, the Celery worker and the bot engine.
+
+Metrics live in each process's default registry. When the API and the worker
+run several processes (uvicorn workers, Celery prefork children), point
+PROMETHEUS_MULTIPROC_DIR at a shared, empty directory for all of them and
+every exporter serves the aggregate of all processes instead.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    start_http_server,
+)
+from prometheus_client import multiprocess
+
+# Bot steps range from a few ms (db_log) to tens of seconds (login).
+_STEP_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+
+BOT_STEP_SECONDS = Histogram(
+    "naukri_bot_step_seconds", "Duration of bot run steps (login, search, parse, apply, db_log).",
+    ["step"], buckets=_STEP_BUCKETS,
+)
+BOT_JOBS = Counter(
+    "naukri_bot_jobs_total", "Jobs handled by the apply bot, by outcome.", ["outcome"],
+)
+BOT_RUNS = Counter(
+    "naukri_bot_runs_total", "Bot task runs, by final status.", ["status"],
+)
+
+BROWSER_LAUNCHES = Counter("naukri_browser_launches_total", "Chromium browsers launched by the pool.")
+BROWSER_RECYCLES = Counter("naukri_browser_recycles_total", "Pooled browsers retired and closed.")
+BROWSERS_OPEN = Gauge(
+    "naukri_browsers_open", "Browsers currently open in the pool.", multiprocess_mode="livesum",
+)
+BROWSER_CONTEXTS_IN_FLIGHT = Gauge(
+    "naukri_browser_contexts_in_flight", "Browser contexts currently in use.", multiprocess_mode="livesum",
+)
+
+TOKEN_CACHE_LOOKUPS = Counter(
+    "naukri_token_cache_lookups_total", "Access token cache lookups, by result (hit or miss).", ["result"],
+)
+TOKEN_CACHE_INVALIDATIONS = Counter(
+    "naukri_token_cache_invalidations_total", "Users whose cached tokens were invalidated.",
+)
+
+CELERY_TASK_SECONDS = Histogram(
+    "naukri_celery_task_seconds", "Celery task run time, by task and final state.",
+    ["task", "state"], buckets=(0.1, 1, 5, 15, 60, 300, 900, 1800, 3600),
+)
+
+
+def metrics_registry():
+    """The registry to export: all processes' metrics in multiprocess mode."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Returns (body, content type) in the Prometheus text format."""
+    return generate_latest(metrics_registry()), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server(port: int):
+    """Serves /metrics on `port` from a background thread (used by the worker)."""
+    start_http_server(port, registry=metrics_registry())
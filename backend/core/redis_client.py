@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+import redis
+
+from .config import settings
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    """Process-wide Redis client (connection-pooled) for locks and counters."""
+    return redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+@lru_cache(maxsize=1)
+def get_async_redis():
+    """Process-wide asyncio Redis client, used by the API for pub/sub streams."""
+    import redis.asyncio
+
+    return redis.asyncio.Redis.from_url(settings.REDIS_URL, decode_responses=True)
@@ -0,0 +1,162 @@
+import json
+import time
+from typing import AsyncIterator, Optional
+
+from .config import settings
+from .redis_client import get_async_redis, get_redis
+
+# A run is identified by its Celery task id. Its live state is a Redis hash,
+# its progress events go out on a pub/sub channel, and a cancel request is a
+# flag key the bot polls between jobs.
+TERMINAL_STATUSES = ("finished", "failed", "cancelled", "skipped")
+_COUNTERS = ("found", "applied", "skipped", "errors", "lost_rows")
+
+
+def _state_key(run_id: str) -> str:
+    return f"bot:run:{run_id}"
+
+
+def _channel(run_id: str) -> str:
+    return f"bot:run:{run_id}:events"
+
+
+def _cancel_key(run_id: str) -> str:
+    return f"bot:run:{run_id}:cancel"
+
+
+class RunCancelled(Exception):
+    """Raised inside the bot when the user has cancelled the run."""
+
+
+def create_run(run_id: str, user_id: int):
+    """Records a newly enqueued run so it can be looked up before a worker picks it up."""
+    now = time.time()
+    client = get_redis()
+    pipe = client.pipeline()
+    pipe.hset(_state_key(run_id), mapping={
+        "run_id": run_id, "user_id": user_id, "status": "queued",
+        "created_at": now, "updated_at": now, **{name: 0 for name in _COUNTERS},
+    })
+    pipe.expire(_state_key(run_id), settings.RUN_STATE_TTL_SECONDS)
+    pipe.execute()
+
+
+def get_run(run_id: str) -> Optional[dict]:
+    """The run's state hash with counters as ints, or None if unknown or expired."""
+    state = get_redis().hgetall(_state_key(run_id))
+    if not state:
+        return None
+    for name in _COUNTERS:
+        state[name] = int(state.get(name, 0))
+    state["user_id"] = int(state["user_id"])
+    for name in ("created_at", "updated_at"):
+        state[name] = float(state[name])
+    return state
+
+
+def request_cancel(run_id: str):
+    get_redis().set(_cancel_key(run_id), 1, ex=settings.RUN_STATE_TTL_SECONDS)
+
+
+class RunProgress:
+    """
+    Worker-side reporter for one run: updates the state hash, publishes
+    every event on the run's channel and mirrors the counters into the
+    Celery result (state PROGRESS) when a `task` is given.
+
+    Its methods do blocking Redis calls; async code calls them through
+    asyncio.to_thread.
+    """
+
+    def __init__(self, run_id: str, user_id: int, task=None,
+                 cancel_check_seconds: float = settings.RUN_CANCEL_CHECK_SECONDS):
+        self.run_id = run_id
+        self.user_id = user_id
+        self.task = task
+        self.cancel_check_seconds = cancel_check_seconds
+        self.counts = {name: 0 for name in _COUNTERS}
+        self._cancelled = False
+        self._checked_at = 0.0
+
+    def _publish(self, event: dict, status: Optional[str] = None):
+        event = {"run_id": self.run_id, "time": time.time(), **event}
+        fields = {"updated_at": event["time"], **self.counts}
+        if status:
+            fields["status"] = status
+        client = get_redis()
+        pipe = client.pipeline()
+        pipe.hset(_state_key(self.run_id), mapping=fields)
+        pipe.expire(_state_key(self.run_id), settings.RUN_STATE_TTL_SECONDS)
+        pipe.publish(_channel(self.run_id), json.dumps(event))
+        pipe.execute()
+
+    def status(self, status: str, **details):
+        self._publish({"type": "status", "status": status, **details}, status=status)
+
+    def job(self, outcome: str, title: str = "", company: str = "", url: Optional[str] = None, reason: str = ""):
+        """
+        `outcome` is "queued" or "skipped" when the scanner finds a job (both
+        count as found), then "applied" or "error" for queued jobs.
+        """
+        if outcome in ("queued", "skipped"):
+            self.counts["found"] += 1
+        if outcome in ("applied", "skipped"):
+            self.counts[outcome] += 1
+        elif outcome == "error":
+            self.counts["errors"] += 1
+        self._publish({"type": "job", "outcome": outcome, "title": title, "company": company, "url": url, "reason": reason})
+        if self.task is not None:
+            self.task.update_state(state="PROGRESS", meta={"run_id": self.run_id, **self.counts})
+
+    def rows_lost(self, count: int):
+        """Applications made on Naukri whose history rows could not be saved."""
+        self.counts["lost_rows"] += count
+        self._publish({"type": "lost_rows", "count": count})
+
+    def finish(self, status: str, **details):
+        self._publish({"type": "finished", "status": status, **details}, status=status)
+
+    def is_cancelled(self) -> bool:
+        """Polls the cancel flag at most every `cancel_check_seconds`."""
+        now = time.monotonic()
+        if not self._cancelled and now - self._checked_at >= self.cancel_check_seconds:
+            self._checked_at = now
+            self._cancelled = bool(get_redis().exists(_cancel_key(self.run_id)))
+        return self._cancelled
+
+    def raise_if_cancelled(self):
+        if self.is_cancelled():
+            raise RunCancelled(f"Run {self.run_id} was cancelled")
+
+
+def _sse(event_type: str, data: dict) -> str:
+    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_run_events(run_id: str) -> AsyncIterator[str]:
+    """
+    Server-Sent Events for one run: the current state first, then every
+    progress event until the run finishes, with keep-alive comments while
+    it is quiet.
+    """
+    client = get_async_redis()
+    pubsub = client.pubsub()
+    # Subscribe before reading the state so no event falls in between.
+    await pubsub.subscribe(_channel(run_id))
+    try:
+        state = await client.hgetall(_state_key(run_id))
+        yield _sse("state", state)
+        if state.get("status") in TERMINAL_STATUSES:
+            return
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=settings.RUN_EVENTS_KEEPALIVE_SECONDS)
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            event = json.loads(message["data"])
+            yield _sse(event["type"], event)
+            if event["type"] == "finished":
+                return
+    finally:
+        await pubsub.unsubscribe(_channel(run_id))
+        await pubsub.aclose()
@@ -0,0 +1,37 @@
+"""
+Enqueues Celery tasks by name, so the API process never imports the task
+modules (or the bot engine behind them). Celery itself is only loaded on
+the first send.
+"""
+
+RUN_BOT_TASK = "backend.tasks.run_bot_task.run_naukri_bot_for_user"
+SCHEDULE_DAILY_SCAN_TASK = "backend.tasks.daily_scan.schedule_daily_scan"
+
+
+def send_task(name: str, args=(), kwargs=None, **options):
+    """
+    Returns the task's AsyncResult, like `task.apply_async` would. Options
+    such as `task_id` are passed through.
+    """
+    from .celery_app import celery_app
+
+    if celery_app.conf.task_always_eager:
+        # send_task always goes through the broker; eager mode (tests, local
+        # runs without Redis) needs the registered task object instead.
+        celery_app.loader.import_default_modules()
+        return celery_app.tasks[name].apply(args=args, kwargs=kwargs, **options)
+    return celery_app.send_task(name, args=args, kwargs=kwargs, **options)
+
+
+def task_state(task_id: str) -> str:
+    """The Celery state of a task: PENDING, STARTED, PROGRESS, SUCCESS, ..."""
+    from .celery_app import celery_app
+
+    return celery_app.AsyncResult(task_id).state
+
+
+def revoke(task_id: str):
+    """Stops a queued task from starting; a running one must stop itself."""
+    from .celery_app import celery_app
+
+    celery_app.control.revoke(task_id)
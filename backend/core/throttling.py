@@ -0,0 +1,68 @@
+import asyncio
+import time
+import uuid
+from contextlib import contextmanager
+
+from .config import settings
+from .redis_client import get_redis
+
+# Deletes the lock only if we still own it, so an expired lock that another
+# run has since taken is never released by mistake.
+_RELEASE_LOCK = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RunAlreadyInProgress(Exception):
+    """Raised when a bot run for the same user is already running."""
+
+
+@contextmanager
+def user_run_lock(user_id: int, ttl_seconds: int = settings.BOT_TASK_TIME_LIMIT_SECONDS):
+    """
+    Cluster-wide lock that allows one bot run per user at a time. The TTL
+    matches the task time limit so a crashed worker cannot hold it forever.
+    """
+    client = get_redis()
+    key = f"bot:run-lock:{user_id}"
+    token = uuid.uuid4().hex
+    if not client.set(key, token, nx=True, ex=ttl_seconds):
+        raise RunAlreadyInProgress(f"A bot run for user {user_id} is already in progress")
+    try:
+        yield
+    finally:
+        client.eval(_RELEASE_LOCK, 1, key, token)
+
+
+class ApplicationRateLimiter:
+    """
+    Global cap on outbound applications per minute across every worker,
+    implemented as a fixed-window counter in Redis. `acquire` waits for the
+    next window once the current one is used up.
+    """
+
+    def __init__(self, per_minute: int = settings.BOT_APPLICATIONS_PER_MINUTE):
+        self.per_minute = per_minute
+
+    def _try_acquire(self) -> float:
+        """Takes a slot and returns 0, or returns the seconds to wait for the next window."""
+        window = int(time.time() // 60)
+        key = f"bot:apply-rate:{window}"
+        client = get_redis()
+        pipe = client.pipeline()
+        pipe.incr(key)
+        pipe.expire(key, 120)
+        count, _ = pipe.execute()
+        if count <= self.per_minute:
+            return 0.0
+        return (window + 1) * 60 - time.time()
+
+    async def acquire(self):
+        while True:
+            wait = await asyncio.to_thread(self._try_acquire)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
@@ -1,21 +1,102 @@
+import base64
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import func, insert, or_, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from . import models, schemas
-from ..auth.password_utils import hash_password
+from ..auth.token_cache import token_cache
+
+if TYPE_CHECKING:
+    # Annotations only; database.py imports the async extension when it builds the engine.
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 def get_user_by_username(db: Session, username: str):
     return db.query(models.User).filter(models.User.username == username).first()
 
+async def get_user_by_username_async(db: "AsyncSession", username: str):
+    return (await db.execute(select(models.User).where(models.User.username == username))).scalars().first()
+
 def get_users(db: Session, skip: int = 0, limit: int = 100):
     return db.query(models.User).offset(skip).limit(limit).all()
 
-def create_user(db: Session, user: schemas.UserCreate):
-    hashed_password = hash_password(user.password.get_secret_value())
+async def create_user_async(db: "AsyncSession", user: schemas.UserCreate, hashed_password: str):
+    """`hashed_password` comes from password_utils.hash_password_async, off the event loop."""
     db_user = models.User(email=user.email, username=user.username, hashed_password=hashed_password)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
+def update_user_flags(db: Session, user: models.User, is_active: Optional[bool] = None, is_superuser: Optional[bool] = None):
+    """Activates/deactivates or promotes/demotes a user and drops their cached tokens."""
+    if is_active is not None:
+        user.is_active = is_active
+    if is_superuser is not None:
+        user.is_superuser = is_superuser
+    db.commit()
+    db.refresh(user)
+    token_cache.invalidate_user(user.id)
+    return user
+
+async def update_password_hash_async(db: "AsyncSession", user: models.User, hashed_password: str):
+    user.hashed_password = hashed_password
+    await db.commit()
+    return user
+
+def get_active_user_ids_with_profile(db: Session) -> list[int]:
+    """Ids of all active users who have filled in a bot profile."""
+    rows = db.execute(
+        select(models.User.id)
+        .join(models.Profile, models.Profile.owner_id == models.User.id)
+        .where(models.User.is_active.is_(True))
+        .order_by(models.User.id)
+    )
+    return list(rows.scalars())
+
+def get_weekly_report_rows(db: Session, since: datetime):
+    """
+    One row per active user with activity since `since`: applied count,
+    distinct companies applied to and new recommendations. Both tables are
+    aggregated with GROUP BY in a single statement (no per-user queries).
+    """
+    applied = (
+        select(
+            models.AppliedJob.user_id,
+            func.count().label("applied_count"),
+            func.count(func.distinct(models.AppliedJob.company_name)).label("companies_count"),
+        )
+        .where(models.AppliedJob.applied_date >= since)
+        .group_by(models.AppliedJob.user_id)
+        .subquery()
+    )
+    recommended = (
+        select(models.RecommendedJob.user_id, func.count().label("recommended_count"))
+        .where(models.RecommendedJob.recommended_date >= since)
+        .group_by(models.RecommendedJob.user_id)
+        .subquery()
+    )
+    stmt = (
+        select(
+            models.User.id,
+            models.User.username,
+            models.User.email,
+            func.coalesce(applied.c.applied_count, 0).label("applied_count"),
+            func.coalesce(applied.c.companies_count, 0).label("companies_count"),
+            func.coalesce(recommended.c.recommended_count, 0).label("recommended_count"),
+        )
+        .outerjoin(applied, applied.c.user_id == models.User.id)
+        .outerjoin(recommended, recommended.c.user_id == models.User.id)
+        .where(models.User.is_active.is_(True))
+        .where(or_(applied.c.user_id.is_not(None), recommended.c.user_id.is_not(None)))
+    )
+    return db.execute(stmt).all()
+
+def get_user(db: Session, user_id: int):
+    return db.get(models.User, user_id)
+
 def get_applied_jobs(db: Session, user_id: int, skip: int = 0, limit: int = 100):
     return db.query(models.AppliedJob).filter(models.AppliedJob.user_id == user_id).offset(skip).limit(limit).all()
 
@@ -29,6 +110,80 @@ def create_applied_job(db: Session, job: schemas.AppliedJobCreate, user_id: int)
 def get_recommended_jobs(db: Session, user_id: int, skip: int = 0, limit: int = 100):
     return db.query(models.RecommendedJob).filter(models.RecommendedJob.user_id == user_id).offset(skip).limit(limit).all()
 
+# --- Keyset pagination ---
+# Pages are ordered by (date, id) and a cursor holds the last row's values, so
+# fetching page N costs the same as page 1 (no OFFSET scan). Each listing is
+# backed by a (user_id, date, id) index.
+
+def encode_cursor(date: datetime, row_id: int) -> str:
+    raw = json.dumps([date.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Raises ValueError for a malformed cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(date), int(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+def _keyset_statement(model, date_col, user_id: int, cursor: Optional[str], limit: int, sort: str, filters: list):
+    newest_first = sort != "oldest"
+    stmt = select(model).where(model.user_id == user_id, *filters)
+    if cursor:
+        last = tuple_(date_col, model.id)
+        boundary = tuple_(*decode_cursor(cursor))
+        stmt = stmt.where(last < boundary if newest_first else last > boundary)
+    order = (date_col.desc(), model.id.desc()) if newest_first else (date_col.asc(), model.id.asc())
+    # One extra row tells us whether there is a next page.
+    return stmt.order_by(*order).limit(limit + 1)
+
+def _date_and_text_filters(model, date_col, company, title, date_from, date_to):
+    filters = []
+    if company:
+        filters.append(model.company_name.icontains(company, autoescape=True))
+    if title:
+        filters.append(model.job_title.icontains(title, autoescape=True))
+    if date_from:
+        filters.append(date_col >= date_from)
+    if date_to:
+        filters.append(date_col <= date_to)
+    return filters
+
+def applied_jobs_statement(user_id: int, cursor: Optional[str] = None, limit: int = 100, sort: str = "newest",
+                           company: Optional[str] = None, title: Optional[str] = None,
+                           date_from: Optional[datetime] = None, date_to: Optional[datetime] = None):
+    model = models.AppliedJob
+    filters = _date_and_text_filters(model, model.applied_date, company, title, date_from, date_to)
+    return _keyset_statement(model, model.applied_date, user_id, cursor, limit, sort, filters)
+
+def recommended_jobs_statement(user_id: int, cursor: Optional[str] = None, limit: int = 100, sort: str = "newest",
+                               company: Optional[str] = None, title: Optional[str] = None,
+                               date_from: Optional[datetime] = None, date_to: Optional[datetime] = None,
+                               matched_keyword: Optional[str] = None):
+    model = models.RecommendedJob
+    filters = _date_and_text_filters(model, model.recommended_date, company, title, date_from, date_to)
+    if matched_keyword:
+        filters.append(model.matched_keyword == matched_keyword)
+    return _keyset_statement(model, model.recommended_date, user_id, cursor, limit, sort, filters)
+
+def split_page(rows: list, limit: int, date_attr: str) -> tuple[list, Optional[str]]:
+    """Trims the extra lookahead row and returns (rows, next_cursor)."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, date_attr), last.id)
+
+async def get_applied_jobs_page_async(db: "AsyncSession", user_id: int, limit: int = 100, **options):
+    rows = (await db.execute(applied_jobs_statement(user_id, limit=limit, **options))).scalars().all()
+    return split_page(rows, limit, "applied_date")
+
+async def get_recommended_jobs_page_async(db: "AsyncSession", user_id: int, limit: int = 100, **options):
+    rows = (await db.execute(recommended_jobs_statement(user_id, limit=limit, **options))).scalars().all()
+    return split_page(rows, limit, "recommended_date")
+
 def create_recommended_job(db: Session, job: schemas.RecommendedJobCreate, user_id: int):
     existing_job = db.query(models.RecommendedJob).filter(models.RecommendedJob.job_link == job.job_link, models.RecommendedJob.user_id == user_id).first()
     if existing_job:
@@ -38,3 +193,29 @@ def create_recommended_job(db: Session, job: schemas.RecommendedJobCreate, user_
     db.commit()
     db.refresh(db_job)
     return db_job
+
+def _insert_ignoring_duplicates(db: Session, model, rows: list[dict]) -> int:
+    """
+    Inserts many rows in one statement, silently skipping rows that hit a
+    unique constraint (INSERT ... ON CONFLICT DO NOTHING). Returns how many
+    rows were actually inserted.
+    """
+    if not rows:
+        return 0
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert_for = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        # RETURNING yields only the inserted rows; rowcount is unreliable for executemany.
+        stmt = insert_for(model).on_conflict_do_nothing().returning(model.id)
+        inserted = len(db.execute(stmt, rows).all())
+    else:
+        stmt = insert(model).prefix_with("IGNORE")
+        inserted = db.execute(stmt, rows).rowcount
+    db.commit()
+    return inserted
+
+def bulk_create_applied_jobs(db: Session, rows: list[dict]) -> int:
+    return _insert_ignoring_duplicates(db, models.AppliedJob, rows)
+
+def bulk_create_recommended_jobs(db: Session, rows: list[dict]) -> int:
+    return _insert_ignoring_duplicates(db, models.RecommendedJob, rows)
@@ -1,11 +1,78 @@
-from sqlalchemy import create_engine
+from functools import lru_cache
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from ..core.config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+# Async drivers used for the async engine when ASYNC_DATABASE_URL is not set.
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(url: URL) -> dict:
+    """
+    Per-dialect keyword arguments for create_engine/create_async_engine.
+
+    SQLite gets a small pool (WAL allows concurrent readers but one writer
+    at a time) and a busy timeout instead of failing on a locked database;
+    in-memory SQLite shares one connection. Server databases get a sized,
+    pre-pinged, recycled pool.
+    """
+    if url.get_backend_name() == "sqlite":
+        options = {"connect_args": {"timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000}}
+        if url.get_driver_name() == "pysqlite":
+            options["connect_args"]["check_same_thread"] = False
+        if _is_memory_sqlite(url):
+            options["poolclass"] = StaticPool
+        else:
+            options.update(pool_size=settings.SQLITE_POOL_SIZE, max_overflow=0, pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS)
+        return options
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": True,
+    }
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        # WAL lets API reads proceed while a Celery worker is writing.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE_MB) * 1024 * 1024}")
+    finally:
+        cursor.close()
+
+
+def make_engine(database_url: str = settings.DATABASE_URL):
+    url = make_url(database_url)
+    engine = create_engine(url, **engine_options(url))
+    if url.get_backend_name() == "sqlite" and not _is_memory_sqlite(url):
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def async_database_url(database_url: str = settings.DATABASE_URL) -> URL:
+    """The async-driver form of a database URL, e.g. sqlite+aiosqlite://..."""
+    if settings.ASYNC_DATABASE_URL:
+        return make_url(settings.ASYNC_DATABASE_URL)
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver known for {url.get_backend_name()}; set ASYNC_DATABASE_URL")
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}")
+
+
+engine = make_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
@@ -14,3 +81,30 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+@lru_cache(maxsize=1)
+def get_async_engine():
+    """
+    Process-wide async engine, created on first use so processes that never
+    touch it (Celery workers, scripts) do not need the async driver.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = async_database_url()
+    async_engine = create_async_engine(url, **engine_options(url))
+    if url.get_backend_name() == "sqlite" and not _is_memory_sqlite(url):
+        event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return async_engine
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker():
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    return async_sessionmaker(get_async_engine(), class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy import select
+
+from . import models
+from .database import SessionLocal
+
+# Rows are pulled from the DB cursor this many at a time and each chunk is
+# encoded and sent before the next one is read, so memory stays flat.
+EXPORT_CHUNK_SIZE = 1000
+
+EXPORT_COLUMNS = {
+    "applied": ("id", "job_title", "company_name", "job_link", "applied_date"),
+    "recommended": ("id", "job_title", "company_name", "job_link", "matched_keyword", "recommended_date"),
+}
+
+
+def _history_statement(kind: str, user_id: int, date_from: Optional[datetime], date_to: Optional[datetime]):
+    model = models.AppliedJob if kind == "applied" else models.RecommendedJob
+    date_col = model.applied_date if kind == "applied" else model.recommended_date
+    columns = [getattr(model, name) for name in EXPORT_COLUMNS[kind]]
+    stmt = select(*columns).where(model.user_id == user_id)
+    if date_from:
+        stmt = stmt.where(date_col >= date_from)
+    if date_to:
+        stmt = stmt.where(date_col <= date_to)
+    return stmt.order_by(date_col, model.id).execution_options(yield_per=EXPORT_CHUNK_SIZE)
+
+
+def _encode_csv(kind: str, chunks) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS[kind])
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _encode_ndjson(kind: str, chunks) -> Iterator[str]:
+    columns = EXPORT_COLUMNS[kind]
+    for rows in chunks:
+        yield "".join(json.dumps(dict(zip(columns, row)), default=str) + "\n" for row in rows)
+
+
+def _gzip(parts: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+    for part in parts:
+        compressed = compressor.compress(part)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_history(user_id: int, kind: str = "applied", fmt: str = "csv", compress: bool = False,
+                   date_from: Optional[datetime] = None, date_to: Optional[datetime] = None) -> Iterator[bytes]:
+    """
+    Yields a user's full AppliedJob or RecommendedJob history as CSV or
+    NDJSON bytes, optionally gzip-compressed.
+
+    The generator opens its own session because it keeps reading after the
+    request's dependencies have been torn down.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(_history_statement(kind, user_id, date_from, date_to))
+        chunks = (list(chunk) for chunk in result.partitions())
+        encode = _encode_csv if fmt == "csv" else _encode_ndjson
+        parts = (text.encode("utf-8") for text in encode(kind, chunks) if text)
+        yield from (_gzip(parts) if compress else parts)
+    finally:
+        db.close()
@@ -0,0 +1,63 @@
+# Schema management entry point (the API no longer creates tables itself).
+#
+#   python -m backend.db.migrate            # upgrade the database to head
+#   python -m backend.db.migrate --check    # exit 1 unless already at head
+#
+# A database created by the old create_all() start-up already has the
+# baseline tables: mark it once with `alembic stamp 0001`, then upgrade as
+# usual to apply the later revisions.
+
+import argparse
+import sys
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from .database import engine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+def alembic_config() -> Config:
+    config = Config(str(ALEMBIC_INI))
+    # Relative to the ini file, so this works from any working directory.
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "alembic"))
+    return config
+
+
+def head_revisions(config: Config) -> set:
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def current_revisions() -> set:
+    with engine.connect() as connection:
+        return set(MigrationContext.configure(connection).get_current_heads())
+
+
+def check(config: Config) -> bool:
+    """True if the database is at the latest revision; reads only, never migrates."""
+    current, heads = current_revisions(), head_revisions(config)
+    if current == heads:
+        print(f"Database is up to date ({', '.join(sorted(heads))}).")
+        return True
+    print(f"Database is at {', '.join(sorted(current)) or 'no revision'}, expected {', '.join(sorted(heads))}. "
+          f"Run `python -m backend.db.migrate`.")
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply or verify the database migrations.")
+    parser.add_argument("--check", action="store_true", help="only verify the database is at the latest revision")
+    args = parser.parse_args(argv)
+
+    config = alembic_config()
+    if args.check:
+        sys.exit(0 if check(config) else 1)
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    main()
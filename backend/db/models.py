@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime
 
@@ -29,7 +29,10 @@ class Profile(Base):
     blacklisted_companies = Column(String)
     blacklisted_keywords = Column(String)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # Bumped by SQLAlchemy on every update; keys the compiled profile cache.
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     owner = relationship("User", back_populates="profile")
+    __mapper_args__ = {"version_id_col": version}
 
 class AppliedJob(Base):
     __tablename__ = "applied_jobs"
@@ -40,14 +43,23 @@ class AppliedJob(Base):
     applied_date = Column(DateTime, default=datetime.utcnow)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     owner = relationship("User", back_populates="applied_jobs")
+    __table_args__ = (
+        Index("ix_applied_jobs_user_link", "user_id", "job_link", unique=True),
+        Index("ix_applied_jobs_user_date_id", "user_id", "applied_date", "id"),
+    )
 
 class RecommendedJob(Base):
     __tablename__ = "recommended_jobs"
     id = Column(Integer, primary_key=True, index=True)
     job_title = Column(String, index=True)
     company_name = Column(String, index=True)
-    job_link = Column(String, unique=True)
+    job_link = Column(String)
     matched_keyword = Column(String, index=True)
     recommended_date = Column(DateTime, default=datetime.utcnow)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     owner = relationship("User", back_populates="recommended_jobs")
+    __table_args__ = (
+        Index("ix_recommended_jobs_user_link", "user_id", "job_link", unique=True),
+        Index("ix_recommended_jobs_user_date_id", "user_id", "recommended_date", "id"),
+        Index("ix_recommended_jobs_user_keyword", "user_id", "matched_keyword"),
+    )
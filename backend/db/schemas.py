@@ -15,6 +15,10 @@ class User(UserBase):
     is_superuser: bool
     model_config = ConfigDict(from_attributes=True)
 
+class UserFlagsUpdate(BaseModel):
+    is_active: Optional[bool] = None
+    is_superuser: Optional[bool] = None
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -51,7 +55,7 @@ class RecommendedJobBase(BaseModel):
     job_title: str
     company_name: str
     job_link: str
-    matched_keyword: str
+    matched_keyword: Optional[str] = None
 
 class RecommendedJobCreate(RecommendedJobBase):
     pass
@@ -61,3 +65,19 @@ class RecommendedJob(RecommendedJobBase):
     user_id: int
     recommended_date: datetime
     model_config = ConfigDict(from_attributes=True)
+
+class RunStarted(BaseModel):
+    message: str
+    run_id: str
+
+class RunStatus(BaseModel):
+    run_id: str
+    status: str
+    task_state: str
+    found: int = 0
+    applied: int = 0
+    skipped: int = 0
+    errors: int = 0
+    lost_rows: int = 0
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,202 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from ..core.config import settings
+from . import crud
+from .database import SessionLocal
+
+
+@dataclass
+class WriterStats:
+    batches: int = 0
+    # Rows handed to the writer vs. rows the database actually inserted
+    # (duplicates are skipped by ON CONFLICT DO NOTHING).
+    rows: int = 0
+    inserted_rows: int = 0
+    max_batch_size: int = 0
+    failed_batches: int = 0
+    retries: int = 0
+    lost_rows: int = 0
+    lost_rows_by_user: dict = field(default_factory=dict)
+    last_flush_ms: float = 0.0
+    total_flush_s: float = 0.0
+
+    @property
+    def avg_batch_size(self) -> float:
+        return self.rows / self.batches if self.batches else 0.0
+
+    @property
+    def avg_flush_ms(self) -> float:
+        return 1000 * self.total_flush_s / self.batches if self.batches else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "inserted_rows": self.inserted_rows,
+            "failed_batches": self.failed_batches,
+            "retries": self.retries,
+            "lost_rows": self.lost_rows,
+            "avg_batch_size": round(self.avg_batch_size, 1),
+            "max_batch_size": self.max_batch_size,
+            "last_flush_ms": round(self.last_flush_ms, 1),
+            "avg_flush_ms": round(self.avg_flush_ms, 1),
+        }
+
+
+class WriteBehindWriter:
+    """
+    Buffers AppliedJob/RecommendedJob rows produced by bot runs and writes
+    them in bulk INSERT ... ON CONFLICT DO NOTHING batches.
+
+    A batch is flushed once it holds `batch_size` rows or `flush_interval`
+    seconds after its first row, whichever comes first. The buffer holds at
+    most `max_pending` rows; producers wait (back-pressure) when it is full.
+
+    A batch that fails to write is retried up to `max_retries` times with
+    doubling waits, then written one row at a time. Rows that still fail are
+    counted in `stats.lost_rows` (and per user in `stats.lost_rows_by_user`)
+    for the caller to report.
+    Use it as an async context manager so everything buffered is flushed on
+    shutdown:
+
+        async with WriteBehindWriter() as writer:
+            await writer.add_applied(user_id, title, company, link)
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.WRITER_BATCH_SIZE,
+        flush_interval: float = settings.WRITER_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = settings.WRITER_MAX_PENDING,
+        max_retries: int = settings.WRITER_MAX_RETRIES,
+        retry_backoff: float = settings.WRITER_RETRY_BACKOFF_SECONDS,
+        session_factory=SessionLocal,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.session_factory = session_factory
+        self.stats = WriterStats()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def add_applied(self, user_id: int, job_title: str, company_name: str, job_link: str, applied_date: Optional[datetime] = None):
+        await self._put(("applied", {
+            "user_id": user_id,
+            "job_title": job_title,
+            "company_name": company_name,
+            "job_link": job_link,
+            "applied_date": applied_date or datetime.utcnow(),
+        }))
+
+    async def add_recommended(self, user_id: int, job_title: str, company_name: str, job_link: str, matched_keyword: Optional[str], recommended_date: Optional[datetime] = None):
+        await self._put(("recommended", {
+            "user_id": user_id,
+            "job_title": job_title,
+            "company_name": company_name,
+            "job_link": job_link,
+            "matched_keyword": matched_keyword,
+            "recommended_date": recommended_date or datetime.utcnow(),
+        }))
+
+    async def _put(self, item):
+        if self._closed:
+            raise RuntimeError("WriteBehindWriter is closed")
+        self.start()
+        await self._queue.put(item)
+
+    async def close(self):
+        """Stops accepting rows and waits until everything buffered is written."""
+        self._closed = True
+        if self._task is None:
+            return
+        await self._queue.put(None)  # sentinel: flush what's left and stop
+        await self._task
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+
+    async def _flush(self, batch):
+        start = time.perf_counter()
+        lost_before = self.stats.lost_rows
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.stats.inserted_rows += await asyncio.to_thread(self._write, batch)
+                break
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.stats.failed_batches += 1
+                    print(f"ERROR: Failed to write a batch of {len(batch)} rows: {e}. Writing them one by one.")
+                    self.stats.inserted_rows += await asyncio.to_thread(self._write_rows, batch)
+                    break
+                delay = self.retry_backoff * 2 ** attempt
+                self.stats.retries += 1
+                print(f"WARNING: Failed to write a batch of {len(batch)} rows: {e}. Retrying in {delay:.1f}s.")
+                await asyncio.sleep(delay)
+        elapsed = time.perf_counter() - start
+        self.stats.batches += 1
+        self.stats.rows += len(batch) - (self.stats.lost_rows - lost_before)
+        self.stats.max_batch_size = max(self.stats.max_batch_size, len(batch))
+        self.stats.last_flush_ms = elapsed * 1000
+        self.stats.total_flush_s += elapsed
+
+    def _write_rows(self, batch) -> int:
+        """Last resort for a failing batch: one row per statement, so one bad row loses only itself."""
+        inserted = 0
+        for kind, row in batch:
+            try:
+                inserted += self._write([(kind, row)])
+            except Exception as e:
+                user_id = row["user_id"]
+                self.stats.lost_rows += 1
+                self.stats.lost_rows_by_user[user_id] = self.stats.lost_rows_by_user.get(user_id, 0) + 1
+                print(f"ERROR: Lost {kind} job row for user {user_id} ({row['job_link']}): {e}")
+        return inserted
+
+    def _write(self, batch) -> int:
+        """Writes one batch and returns how many of its rows were new."""
+        applied = [row for kind, row in batch if kind == "applied"]
+        recommended = [row for kind, row in batch if kind == "recommended"]
+        db = self.session_factory()
+        try:
+            return crud.bulk_create_applied_jobs(db, applied) + crud.bulk_create_recommended_jobs(db, recommended)
+        finally:
+            db.close()
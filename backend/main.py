@@ -1,14 +1,13 @@
 # backend/main.py
 # PASTE THIS ENTIRE CODE BLOCK INTO THE FILE
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from .db import models
-from .db.database import engine
+from .core.metrics import render_metrics
 from .routers import auth, admin, bot # Import your router files
 
-# This ensures all database tables are created on startup
-models.Base.metadata.create_all(bind=engine)
+# The schema is managed by Alembic: run `python -m backend.db.migrate`
+# (or `--check` to verify) before starting the API.
 
 app = FastAPI(
     title="Naukri Bot API",
@@ -33,4 +32,10 @@ app.include_router(bot.router)
 @app.get("/", tags=["Root"])
 def read_root():
     """A simple endpoint to confirm the API is running."""
-    return {"message": "Welcome to the Naukri Bot API!"}
\ No newline at end of file
+    return {"message": "Welcome to the Naukri Bot API!"}
+
+@app.get("/metrics", tags=["Root"], include_in_schema=False)
+def metrics():
+    """Prometheus scrape endpoint (bot and worker metrics too in multiprocess mode)."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
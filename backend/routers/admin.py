@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -24,7 +24,22 @@ def read_users(
     users = crud.get_users(db=db)
     return users
 
+@router.patch("/users/{user_id}", response_model=schemas.User)
+def update_user_flags(
+    user_id: int,
+    flags: schemas.UserFlagsUpdate,
+    db: Session = Depends(get_db),
+    current_user: schemas.User = Depends(get_current_admin_user)
+):
+    """
+    Endpoint to activate/deactivate a user or change their admin status.
+    The user's cached tokens are invalidated so the change applies at once.
+    """
+    user = crud.get_user(db, user_id=user_id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return crud.update_user_flags(db, user, is_active=flags.is_active, is_superuser=flags.is_superuser)
+
 # In the future, you can add more admin-only endpoints here, such as:
-# - An endpoint to update a user's details (e.g., make another user an admin).
 # - An endpoint to delete a user.
 # - An endpoint to view detailed activity for a specific user.
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import timedelta
 
 # Import all the necessary components from our redesigned structure
 from ..db import crud, database, schemas, models
-from ..db.database import get_db
+from ..db.database import get_async_db, get_db
 from ..auth import jwt_handler, password_utils
 from ..auth.dependencies import get_current_active_user
 from ..core.config import settings
@@ -17,34 +18,61 @@ router = APIRouter(
 )
 
 
+def _hashing_busy_exception():
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server is busy, please try again shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=schemas.User, status_code=status.HTTP_201_CREATED)
-def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def register_user(user: schemas.UserCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Endpoint to register a new user.
     It checks if a user with the same username already exists to prevent duplicates.
+
+    Async end to end: the bcrypt hash is awaited on the hashing pool, so a
+    registration holds no request thread.
     """
-    db_user = crud.get_user_by_username(db, username=user.username)
+    db_user = await crud.get_user_by_username_async(db, username=user.username)
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, 
             detail="Username already registered"
         )
-    return crud.create_user(db=db, user=user)
+    try:
+        hashed_password = await password_utils.hash_password_async(user.password.get_secret_value())
+    except password_utils.HashingBusyError:
+        raise _hashing_busy_exception()
+    return await crud.create_user_async(db, user=user, hashed_password=hashed_password)
 
 @router.post("/token", response_model=schemas.Token)
-def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
     """
     Endpoint to handle user login.
     It verifies the username and password and returns a JWT access token if successful.
+    Hashes made with an outdated bcrypt cost are transparently replaced.
+
+    Async end to end: the bcrypt check is awaited on the hashing pool, so a
+    login holds no request thread.
     """
-    user = crud.get_user_by_username(db, username=form_data.username)
+    user = await crud.get_user_by_username_async(db, username=form_data.username)
     # Verify the user exists and the password is correct
-    if not user or not password_utils.verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = False, None
+    if user:
+        try:
+            verified, new_hash = await password_utils.verify_and_update_async(form_data.password, user.hashed_password)
+        except password_utils.HashingBusyError:
+            raise _hashing_busy_exception()
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if new_hash:
+        await crud.update_password_hash_async(db, user, new_hash)
     
     # Create the access token with an expiration time from our settings
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
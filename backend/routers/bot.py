@@ -1,50 +1,202 @@
-from fastapi import APIRouter, Depends, BackgroundTasks
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Literal, Optional
+import uuid
 
 # Import all the necessary components from our redesigned structure
 from ..db import crud, schemas
-from ..db.database import get_db
+from ..db.database import get_async_db
+from ..db.export import stream_history
 from ..auth.dependencies import get_current_active_user
-from ..tasks import run_bot_task
+from ..core import run_events
+from ..core.task_client import RUN_BOT_TASK, revoke, send_task, task_state
 
 router = APIRouter()
 
-@router.post("/run")
+# Name of the response header carrying the cursor for the next page.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Celery states of a task that is running on a worker right now.
+EXECUTING_TASK_STATES = ("STARTED", "PROGRESS")
+
+@router.post("/run", response_model=schemas.RunStarted)
 def run_bot(
-    background_tasks: BackgroundTasks, 
     current_user: schemas.User = Depends(get_current_active_user)
 ):
     """
     Endpoint to start the bot for the currently logged-in user.
-    It uses BackgroundTasks to run the bot asynchronously, so the API
+    It enqueues a Celery task, so the bot runs on a worker and the API
     can return an immediate response to the frontend.
+
+    The returned `run_id` is used with /runs/{run_id} to follow the run's
+    progress or cancel it.
+    """
+    run_id = uuid.uuid4().hex
+    run_events.create_run(run_id, current_user.id)
+    send_task(RUN_BOT_TASK, args=(current_user.id,), task_id=run_id)
+    return {"message": "Naukri bot task has been started in the background.", "run_id": run_id}
+
+def _get_own_run(run_id: str, user_id: int) -> dict:
+    run = run_events.get_run(run_id)
+    if run is None or run["user_id"] != user_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found")
+    return run
+
+@router.get("/runs/{run_id}", response_model=schemas.RunStatus)
+def get_run_status(
+    run_id: str,
+    current_user: schemas.User = Depends(get_current_active_user)
+):
+    """
+    Endpoint to get a run's status and job counters, along with the state
+    of its Celery task (PENDING, STARTED, PROGRESS, SUCCESS, FAILURE, ...).
+    """
+    run = _get_own_run(run_id, current_user.id)
+    return {
+        **run,
+        "created_at": datetime.fromtimestamp(run["created_at"]),
+        "updated_at": datetime.fromtimestamp(run["updated_at"]),
+        "task_state": task_state(run_id),
+    }
+
+@router.get("/runs/{run_id}/events")
+def stream_run(
+    run_id: str,
+    current_user: schemas.User = Depends(get_current_active_user)
+):
+    """
+    Endpoint streaming a run's progress as Server-Sent Events: a `state`
+    event with the current status, then `status` and per-job `job` events,
+    and a final `finished` event, after which the stream ends.
     """
-    # The actual bot logic is now a Celery task, which is added to the background.
-    background_tasks.add_task(run_bot_task.run_naukri_bot_for_user, user_id=current_user.id)
-    return {"message": "Naukri bot task has been started in the background."}
+    _get_own_run(run_id, current_user.id)
+    return StreamingResponse(
+        run_events.stream_run_events(run_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.post("/runs/{run_id}/cancel", status_code=status.HTTP_202_ACCEPTED)
+def cancel_run(
+    run_id: str,
+    current_user: schemas.User = Depends(get_current_active_user)
+):
+    """
+    Endpoint to cancel a run. A queued run, or one waiting to be retried,
+    never starts again; a running one stops before its next job and closes
+    its browser session.
+    """
+    run = _get_own_run(run_id, current_user.id)
+    if run["status"] in run_events.TERMINAL_STATUSES:
+        return {"message": f"Run already {run['status']}."}
+    run_events.request_cancel(run_id)
+    revoke(run_id)
+    if task_state(run_id) not in EXECUTING_TASK_STATES:
+        # Queued, waiting to retry or gone: a revoked task never runs again,
+        # so nothing else would close the run.
+        progress = run_events.RunProgress(run_id, current_user.id)
+        # Keep the counters of the attempts that already ran.
+        progress.counts.update((name, run[name]) for name in progress.counts)
+        progress.finish("cancelled", **progress.counts)
+    return {"message": "Cancellation requested."}
 
 @router.get("/applied-jobs", response_model=List[schemas.AppliedJob])
-def get_applied_jobs(
-    db: Session = Depends(get_db), 
+async def get_applied_jobs(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    sort: Literal["newest", "oldest"] = "newest",
+    company: Optional[str] = None,
+    title: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_db),
     current_user: schemas.User = Depends(get_current_active_user)
 ):
     """
     Endpoint to retrieve the list of jobs the bot has applied to
     for the currently logged-in user.
+
+    Results are keyset-paginated: when more rows exist, the response carries
+    an `X-Next-Cursor` header whose value is passed back as `cursor` to get
+    the next page. `company` and `title` are case-insensitive substring
+    filters; `date_from`/`date_to` bound the applied date.
+
+    Runs on an AsyncSession, so the query does not hold a threadpool worker.
     """
-    return crud.get_applied_jobs(db=db, user_id=current_user.id)
+    try:
+        jobs, next_cursor = await crud.get_applied_jobs_page_async(
+            db, user_id=current_user.id, cursor=cursor, limit=limit, sort=sort,
+            company=company, title=title, date_from=date_from, date_to=date_to,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return jobs
 
 @router.get("/recommend", response_model=List[schemas.RecommendedJob])
-def get_recommendations(
-    db: Session = Depends(get_db), 
+async def get_recommendations(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    sort: Literal["newest", "oldest"] = "newest",
+    company: Optional[str] = None,
+    title: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    matched_keyword: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
     current_user: schemas.User = Depends(get_current_active_user)
 ):
     """
     Endpoint to retrieve the list of jobs recommended for the
     currently logged-in user.
+
+    Paginated and filtered like /applied-jobs, plus an exact
+    `matched_keyword` filter.
     """
     # Note: The actual process of finding recommendations should be a
     # separate background task. This endpoint simply retrieves the
     # results that have been saved to the database.
-    return crud.get_recommended_jobs(db=db, user_id=current_user.id)
+    try:
+        jobs, next_cursor = await crud.get_recommended_jobs_page_async(
+            db, user_id=current_user.id, cursor=cursor, limit=limit, sort=sort,
+            company=company, title=title, date_from=date_from, date_to=date_to,
+            matched_keyword=matched_keyword,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return jobs
+
+@router.get("/export")
+def export_history(
+    kind: Literal["applied", "recommended"] = "applied",
+    format: Literal["csv", "ndjson"] = "csv",
+    gzip: bool = False,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    current_user: schemas.User = Depends(get_current_active_user)
+):
+    """
+    Endpoint to download the current user's complete applied or
+    recommended job history as CSV or NDJSON.
+
+    Rows are streamed from the database in chunks, so the export size is
+    not limited and memory use does not grow with it. Set `gzip=true` for
+    a compressed download.
+    """
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    filename = f"{kind}_jobs.{format}" + (".gz" if gzip else "")
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if gzip:
+        media_type = "application/gzip"
+    return StreamingResponse(
+        stream_history(current_user.id, kind, format, gzip, date_from, date_to),
+        media_type=media_type,
+        headers=headers,
+    )
@@ -0,0 +1,132 @@
+# This file defines the daily job scan: a beat task that splits all active
+# users into shards and releases them, a wave at a time, as scan tasks.
+
+import json
+import random
+import statistics
+import time
+import uuid
+
+from celery.schedules import crontab
+
+from ..core.celery_app import celery_app
+from ..core.config import settings
+from ..core.redis_client import get_redis
+from ..db.database import SessionLocal
+from ..db import crud
+
+# Shard results of one scan are collected here until the last one is in.
+_RESULTS_TTL_SECONDS = 2 * 86400
+
+
+def _results_key(scan_id: str) -> str:
+    return f"daily-scan:{scan_id}:results"
+
+
+@celery_app.on_after_configure.connect
+def setup_daily_scan(sender, **kwargs):
+    """
+    Schedules the daily scan fan-out. The individual shards are spread out
+    from this start time, a wave at a time (see release_scan_wave).
+    """
+    sender.add_periodic_task(
+        crontab(hour=settings.DAILY_SCAN_HOUR, minute=settings.DAILY_SCAN_MINUTE),
+        schedule_daily_scan.s(),
+        name='fan out daily job scan',
+    )
+
+
+@celery_app.task
+def schedule_daily_scan():
+    """
+    Shards every active user with a profile into chunks of
+    DAILY_SCAN_SHARD_SIZE and starts releasing them (see release_scan_wave).
+    """
+    db = SessionLocal()
+    try:
+        user_ids = crud.get_active_user_ids_with_profile(db)
+    finally:
+        db.close()
+
+    size = max(1, settings.DAILY_SCAN_SHARD_SIZE)
+    shards = [user_ids[i:i + size] for i in range(0, len(user_ids), size)]
+    if not shards:
+        print("INFO: Daily scan: no active users with a profile.")
+        return {"users": 0, "shards": 0}
+
+    scan_id = uuid.uuid4().hex
+    release_scan_wave.delay(scan_id, list(enumerate(shards)), len(shards), time.time())
+    print(f"INFO: Daily scan {scan_id}: {len(user_ids)} users in {len(shards)} shards.")
+    return {"scan_id": scan_id, "users": len(user_ids), "shards": len(shards)}
+
+
+@celery_app.task
+def release_scan_wave(scan_id, shards, shard_count, started_at):
+    """
+    Sends the next DAILY_SCAN_MAX_PARALLEL_SHARDS shards to the scan queue
+    and schedules itself DAILY_SCAN_WAVE_SECONDS (plus jitter) later for the
+    rest, so requests to Naukri are spread out.
+
+    The shards themselves carry no countdown: workers reserve ETA tasks as
+    soon as they are sent, and a shard held that way for longer than the
+    broker's visibility timeout would be delivered twice. Only this small
+    task waits, and never longer than one wave.
+    """
+    per_wave = max(1, settings.DAILY_SCAN_MAX_PARALLEL_SHARDS)
+    for shard_no, user_ids in shards[:per_wave]:
+        scan_user_shard.delay(user_ids, scan_id=scan_id, shard_no=shard_no, shard_count=shard_count, started_at=started_at)
+    rest = shards[per_wave:]
+    if rest:
+        countdown = settings.DAILY_SCAN_WAVE_SECONDS + random.uniform(0, settings.DAILY_SCAN_JITTER_SECONDS)
+        release_scan_wave.apply_async((scan_id, rest, shard_count, started_at), countdown=countdown)
+
+
+@celery_app.task(acks_late=True)
+def scan_user_shard(user_ids, scan_id=None, shard_no=None, shard_count=None, started_at=None):
+    """
+    Scans one shard of users on the worker's event loop and reports its
+    duration. Shards of a daily scan store their result under the scan, and
+    whichever finishes last has the run recorded.
+    """
+    # Imported here so only the worker pays for loading the bot engine.
+    from bot_engine.run_for_user import scan_recommendations_for_users
+
+    start = time.perf_counter()
+    outcome = scan_recommendations_for_users(user_ids)
+    failed = [user_id for user_id, result in outcome.items() if isinstance(result, Exception)]
+    result = {
+        "users": len(user_ids),
+        "failed": len(failed),
+        "recommended": sum(result for result in outcome.values() if isinstance(result, int)),
+        "duration_s": round(time.perf_counter() - start, 2),
+    }
+    if scan_id is not None:
+        # Keyed by shard, so a redelivered shard overwrites its own result.
+        pipe = get_redis().pipeline()
+        pipe.hset(_results_key(scan_id), shard_no, json.dumps(result))
+        pipe.expire(_results_key(scan_id), _RESULTS_TTL_SECONDS)
+        pipe.hlen(_results_key(scan_id))
+        done = pipe.execute()[-1]
+        if done == shard_count:
+            record_daily_scan.delay(scan_id, started_at)
+    return result
+
+
+@celery_app.task
+def record_daily_scan(scan_id, started_at):
+    """Logs per-shard durations and the totals for a finished daily scan."""
+    client = get_redis()
+    shard_results = [json.loads(raw) for raw in client.hvals(_results_key(scan_id))]
+    client.delete(_results_key(scan_id))
+    durations = [result["duration_s"] for result in shard_results]
+    summary = {
+        "shards": len(shard_results),
+        "users": sum(result["users"] for result in shard_results),
+        "failed_users": sum(result["failed"] for result in shard_results),
+        "recommended": sum(result["recommended"] for result in shard_results),
+        "shard_duration_p50_s": round(statistics.median(durations), 2) if durations else 0,
+        "shard_duration_max_s": max(durations, default=0),
+        "wall_time_s": round(time.time() - started_at, 2),
+    }
+    print(f"INFO: Daily scan {scan_id} finished: {summary}")
+    return summary
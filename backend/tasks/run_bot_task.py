@@ -1,57 +1,90 @@
 # This file defines the background task for running the bot.
 # It's a Celery task, which allows it to be executed asynchronously.
 
+import random
+
 # Import the celery_app instance from our new core directory
 from ..core.celery_app import celery_app
-# Import the SessionLocal to create a new database session for this task
-from ..db.database import SessionLocal
-# Import the database interaction functions (crud) and data schemas
-from ..db import crud, schemas
-from datetime import datetime
-import time
-
-# In a real application, you would import your actual bot script here.
-# from ...bot_engine.run_for_user import run_naukri_bot_for_user as run_bot_script
-
-@celery_app.task
-def run_naukri_bot_for_user(user_id: int):
+from ..core.config import settings
+from ..core.metrics import BOT_RUNS
+from ..core.run_events import RunCancelled, RunProgress
+from ..core.throttling import ApplicationRateLimiter, RunAlreadyInProgress, user_run_lock
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Browser crashes, navigation timeouts and dropped connections are worth
+    retrying. A rejected login is not: retrying it only piles up failed
+    logins on the user's Naukri account.
+    """
+    # Imported here so only the worker pays for loading Playwright.
+    from playwright.async_api import Error as PlaywrightError
+    from bot_engine.apply_bot import LoginFailed
+
+    if isinstance(error, LoginFailed):
+        return False
+    return isinstance(error, (PlaywrightError, TimeoutError, ConnectionError))
+
+
+@celery_app.task(bind=True, acks_late=True, max_retries=settings.BOT_TASK_MAX_RETRIES)
+def run_naukri_bot_for_user(self, user_id: int):
     """
     This Celery task runs the job application bot for a specific user.
     It runs in the background, separate from the main API process.
+
+    Only one run per user can be active at a time; a duplicate request is
+    skipped. Applications are throttled by the global rate limit, and
+    transient browser errors are retried with exponential backoff.
+
+    The task id is the run id: progress goes to the run's Redis state and
+    event channel (see run_events), and a cancel request ends the run early.
     """
-    # Each Celery task needs to create its own database session.
-    db = SessionLocal()
+    # Imported here so only the worker pays for loading the bot engine.
+    from bot_engine.run_for_user import run_bots_for_users
+
+    progress = RunProgress(self.request.id, user_id, task=self)
+    if progress.is_cancelled():
+        progress.finish("cancelled")
+        return {"status": "cancelled"}
     try:
-        print(f"INFO: Starting bot task for user_id: {user_id}")
-        
-        # Here, you would fetch the user's profile and credentials to run the bot.
-        # user = crud.get_user(db, user_id=user_id)
-        # if not user:
-        #     print(f"ERROR: User with id {user_id} not found.")
-        #     return
-        
-        # --- Placeholder Bot Logic ---
-        # The actual call to your bot engine (e.g., Playwright/Selenium) would go here.
-        # For this example, we'll simulate the bot's work by waiting for 10 seconds
-        # and then creating a fake "applied job" entry in the database.
-        
-        print(f"INFO: Bot is 'running' for user_id: {user_id}... (Simulating work)")
-        time.sleep(10) 
-        
-        # Create a fake job entry to demonstrate that the task worked.
-        fake_job = schemas.AppliedJobCreate(
-            job_title="Simulated Job Application",
-            company_name="Celery Task Corp",
-            job_link="https://www.naukri.com/simulated-job",
-            applied_date=datetime.utcnow()
-        )
-        crud.create_applied_job(db=db, job=fake_job, user_id=user_id)
-        
-        print(f"INFO: Bot task finished for user_id: {user_id}. A simulated job was 'applied'.")
-
-    except Exception as e:
-        # It's good practice to log any errors that occur within the task.
-        print(f"ERROR: An error occurred in the bot task for user_id {user_id}: {e}")
-    finally:
-        # It's crucial to always close the database session in a finally block.
-        db.close()
+        with user_run_lock(user_id):
+            print(f"INFO: Starting bot task for user_id: {user_id}")
+            progress.status("running", attempt=self.request.retries + 1)
+            outcome = run_bots_for_users(
+                [user_id], rate_limiter=ApplicationRateLimiter(), progress={user_id: progress},
+            )[user_id]
+    except RunAlreadyInProgress as e:
+        print(f"INFO: {e}; skipping this request.")
+        BOT_RUNS.labels(status="skipped").inc()
+        progress.finish("skipped", reason="already running")
+        return {"status": "skipped", "reason": "already running"}
+
+    if isinstance(outcome, RunCancelled):
+        print(f"INFO: Bot task cancelled for user_id: {user_id}.")
+        BOT_RUNS.labels(status="cancelled").inc()
+        progress.finish("cancelled", **progress.counts)
+        return {"status": "cancelled", **progress.counts}
+
+    if outcome is None:
+        progress.finish("failed", reason="no profile")
+        return {"status": "failed", "reason": "no profile"}
+
+    if isinstance(outcome, Exception):
+        if _is_transient(outcome) and self.request.retries < self.max_retries:
+            countdown = settings.BOT_TASK_RETRY_BACKOFF_SECONDS * 2 ** self.request.retries
+            countdown += random.uniform(0, countdown / 2)
+            print(f"WARNING: Transient error for user_id {user_id}: {outcome}. Retrying in {countdown:.0f}s.")
+            BOT_RUNS.labels(status="retried").inc()
+            progress.status("retrying", error=str(outcome), countdown_s=round(countdown))
+            raise self.retry(exc=outcome, countdown=countdown)
+        print(f"ERROR: An error occurred in the bot task for user_id {user_id}: {outcome}")
+        BOT_RUNS.labels(status="failed").inc()
+        progress.finish("failed", error=str(outcome), **progress.counts)
+        raise outcome
+
+    if progress.counts["lost_rows"]:
+        print(f"ERROR: {progress.counts['lost_rows']} applications of user_id {user_id} could not be saved.")
+    print(f"INFO: Bot task finished for user_id: {user_id}.")
+    BOT_RUNS.labels(status="finished").inc()
+    progress.finish("finished", **progress.counts)
+    return {"status": "finished", "timings": outcome, **progress.counts}
@@ -1,7 +1,22 @@
 # This file defines scheduled tasks that run automatically.
 
+import os
+import smtplib
+from datetime import datetime, timedelta
+
 from ..core.celery_app import celery_app
+from ..core.mailer import SMTPMailer
+from ..db.database import SessionLocal
+from ..db import crud
 from celery.schedules import crontab
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+# The report template is loaded and compiled once, not per email.
+_templates = Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), "..", "templates")),
+    autoescape=select_autoescape(["html"]),
+)
+_report_template = _templates.get_template("weekly_report.html")
 
 # This is a special Celery signal that runs after the app is configured.
 # It's the standard place to define your periodic task schedule.
@@ -22,19 +37,40 @@ def setup_periodic_tasks(sender, **kwargs):
 def send_weekly_report():
     """
     This is the actual task that will be run on the schedule.
-    It should contain the logic to generate and email reports to users.
+    It generates and emails the weekly report to every user with activity.
+
+    All per-user numbers come from one aggregated query, the template is
+    compiled once at import, and every email goes over a single SMTP
+    connection.
     """
-    # --- Placeholder Logic ---
-    # In a real application, you would:
-    # 1. Create a database session.
-    # 2. Get a list of all users.
-    # 3. For each user, get their applied jobs for the last week.
-    # 4. Generate an HTML report from a template.
-    # 5. Use an email utility to send the report.
-    
     print("--------------------------------------------------")
     print("INFO: Running scheduled task: Sending weekly reports...")
-    # Add your report generation and sending logic here.
-    print("INFO: Weekly reports task finished.")
-    print("--------------------------------------------------")
+    week_end = datetime.utcnow()
+    week_start = week_end - timedelta(days=7)
 
+    db = SessionLocal()
+    try:
+        rows = crud.get_weekly_report_rows(db, since=week_start)
+    finally:
+        db.close()
+
+    failed = 0
+    with SMTPMailer() as mailer:
+        for row in rows:
+            html = _report_template.render(
+                username=row.username,
+                week_start=week_start,
+                week_end=week_end,
+                applied_count=row.applied_count,
+                companies_count=row.companies_count,
+                recommended_count=row.recommended_count,
+            )
+            try:
+                mailer.send(row.email, "Your weekly Naukri Bot report", html)
+            except smtplib.SMTPException as e:
+                failed += 1
+                print(f"ERROR: Could not send the weekly report to user_id {row.id}: {e}")
+
+    print(f"INFO: Weekly reports task finished: {mailer.sent} sent, {failed} failed.")
+    print("--------------------------------------------------")
+    return {"sent": mailer.sent, "failed": failed}
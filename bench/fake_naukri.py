@@ -0,0 +1,204 @@
+# Local stand-in for the parts of naukri.com the bot touches, for benchmarks.
+#
+# Serves the login form, the logged-in homepage, search result pages made of
+# `article.jobTuple` cards, job pages with an Apply button and the apply
+# request, each after a configurable delay. Search pages are synthetic unless
+# a recorded result page is given. Run it on its own to poke at it:
+#
+#   python -m bench.fake_naukri --port 8089 --latency-ms 100 --cards 20
+
+import argparse
+import html
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+_SEARCH_PATH = re.compile(r"^/(?P<keyword>[a-z0-9-]+?)-jobs(?:-in-(?P<location>[a-z0-9-]+?))?(?:-(?P<page>\d+))?$")
+_JOB_PATH = re.compile(r"^/job-listings-(?P<job_id>[a-z0-9-]+)$")
+_APPLY_PATH = re.compile(r"^/apply/(?P<job_id>[a-z0-9-]+)$")
+
+SESSION_COOKIE = "nauk_at"
+
+LOGIN_PAGE = """<!doctype html><html><body>
+<form method="post" action="/mnjuser/login">
+  <input name="username"><input name="password" type="password">
+  <button type="submit">Login</button>
+</form></body></html>"""
+
+HOME_PAGE = "<!doctype html><html><body><h1>My Naukri</h1></body></html>"
+
+JOB_PAGE = """<!doctype html><html><body>
+<h1>{title}</h1>
+<button id="apply-button" onclick="fetch('/apply/{job_id}', {{method: 'POST'}})">Apply</button>
+</body></html>"""
+
+CARD = """<article class="jobTuple" data-job-id="{job_id}" data-url="/job-listings-{job_id}">
+  <a class="title" href="/job-listings-{job_id}">{title}</a>
+  <a class="subTitle">{company}</a>
+  <span class="expwdth">2-5 Yrs</span>
+  <span class="sal">10-15 Lacs PA</span>
+  <span class="locWdth">{location}</span>
+  <span class="job-post-day">Just Now</span>
+  {apply}
+</article>"""
+
+
+def search_page_html(keyword: str, location: str, page_no: int, cards: int, apply_every: int = 1) -> str:
+    """A synthetic result page; `apply_every` = n gives every n-th card an Apply link."""
+    title = keyword.replace("-", " ").title()
+    where = (location or "remote").replace("-", " ").title()
+    rows = []
+    for i in range(cards):
+        job_id = f"{keyword}-{location or 'any'}-{page_no}-{i}"
+        rows.append(CARD.format(
+            job_id=job_id,
+            title=html.escape(f"{title} {page_no}.{i}"),
+            company=html.escape(f"Company {i % 7}"),
+            location=html.escape(where),
+            apply='<a title="Apply">Apply</a>' if apply_every and i % apply_every == 0 else "",
+        ))
+    return "<!doctype html><html><body>\n" + "\n".join(rows) + "\n</body></html>"
+
+
+class FakeNaukri:
+    """
+    The stand-in site on a background thread. Use as a context manager:
+
+        with FakeNaukri(latency_ms=50, cards_per_page=20) as site:
+            await apply_to_jobs_naukri(..., base_url=site.base_url)
+
+    Every keyword/location search has `pages` result pages; later pages show
+    the no-results block. `search_html` replaces the synthetic cards with a
+    recorded result page. Request counts per kind are kept in `hits`.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0, cards_per_page: int = 20,
+                 pages: int = 2, apply_every: int = 1, search_html: Optional[str] = None):
+        self.latency_ms = latency_ms
+        self.cards_per_page = cards_per_page
+        self.pages = pages
+        self.apply_every = apply_every
+        self.search_html = search_html
+        self.hits = {"login": 0, "home": 0, "search": 0, "job": 0, "apply": 0}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _count(self, kind: str):
+        with self._lock:
+            self.hits[kind] += 1
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body="", headers=None):
+                if site.latency_ms:
+                    time.sleep(site.latency_ms / 1000)
+                payload = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json" if body.startswith("{") else "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _logged_in(self):
+                return f"{SESSION_COOKIE}=" in (self.headers.get("Cookie") or "")
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/mnjuser/login":
+                    site._count("login")
+                    return self._send(200, LOGIN_PAGE)
+                if path == "/mnjuser/homepage":
+                    site._count("home")
+                    if not self._logged_in():
+                        return self._send(302, headers={"Location": "/mnjuser/login"})
+                    return self._send(200, HOME_PAGE)
+                found = _JOB_PATH.match(path)
+                if found:
+                    site._count("job")
+                    job_id = found["job_id"]
+                    return self._send(200, JOB_PAGE.format(title=html.escape(job_id), job_id=job_id))
+                found = _SEARCH_PATH.match(path)
+                if found:
+                    site._count("search")
+                    page_no = int(found["page"] or 1)
+                    if page_no > site.pages:
+                        return self._send(200, '<!doctype html><html><body><div class="noResult">No jobs found</div></body></html>')
+                    if site.search_html is not None:
+                        return self._send(200, site.search_html)
+                    return self._send(200, search_page_html(
+                        found["keyword"], found["location"] or "", page_no, site.cards_per_page, site.apply_every,
+                    ))
+                self._send(404, "<!doctype html><html><body>Not found</body></html>")
+
+            def do_POST(self):
+                path = self.path.split("?", 1)[0]
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if path == "/mnjuser/login":
+                    site._count("login")
+                    cookie = f"{SESSION_COOKIE}=bench; Path=/; Max-Age=86400"
+                    return self._send(303, headers={"Location": "/mnjuser/homepage", "Set-Cookie": cookie})
+                if _APPLY_PATH.match(path):
+                    site._count("apply")
+                    return self._send(200, '{"applied": true}')
+                self._send(404, "{}")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the local Naukri stand-in.")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--cards", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--search-html", help="serve this recorded result page instead of synthetic cards")
+    args = parser.parse_args()
+
+    search_html = None
+    if args.search_html:
+        with open(args.search_html, encoding="utf-8") as f:
+            search_html = f.read()
+    site = FakeNaukri(port=args.port, latency_ms=args.latency_ms, cards_per_page=args.cards,
+                      pages=args.pages, search_html=search_html)
+    print(f"🧪 Fake Naukri on {site.base_url} (Ctrl+C to stop)")
+    with site:
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# Offline benchmark for the bot against the local Naukri stand-in.
+#
+# Measures, without touching naukri.com:
+#   parse:  card parsing throughput of parse_jobs_html on a synthetic page
+#   scan:   scan_jobs over every search page of the stand-in
+#   apply:  apply_to_jobs_naukri for several users at once (login, search,
+#           apply clicks), sharing one BrowserPool as a worker would
+# and reports applications/sec, p50/p99 per step, peak RSS (this process
+# plus Chromium) and browser launches.
+#
+#   python -m bench.run_bench --users 4 --cards 20 --pages 2 --latency-ms 50
+#   python -m bench.run_bench --save bench.json            # record a baseline
+#   python -m bench.run_bench --baseline bench.json        # exit 1 on regression
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from bench.fake_naukri import FakeNaukri, search_page_html  # noqa: E402
+from bot_engine.apply_bot import apply_to_jobs_naukri  # noqa: E402
+from bot_engine.browser_pool import BrowserPool, _children_rss_mb  # noqa: E402
+from bot_engine.concurrency import DomainLimiter  # noqa: E402
+from bot_engine.job_parser import parse_jobs_html  # noqa: E402
+from bot_engine.readiness import StepTimer  # noqa: E402
+from bot_engine.scan_cache import ScanCache  # noqa: E402
+from bot_engine.scanner import scan_jobs  # noqa: E402
+from bot_engine.session_store import SessionStore  # noqa: E402
+
+
+def _self_rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+class RssSampler:
+    """Tracks the peak resident memory of this process plus its browsers."""
+
+    def __init__(self, interval_s: float = 0.2):
+        self.interval_s = interval_s
+        self.peak_mb = 0.0
+        self._task = None
+
+    def sample(self):
+        self.peak_mb = max(self.peak_mb, _self_rss_mb() + (_children_rss_mb() or 0.0))
+
+    async def _run(self):
+        while True:
+            self.sample()
+            await asyncio.sleep(self.interval_s)
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc):
+        self._task.cancel()
+        self.sample()
+
+
+def bench_parse(cards: int, repeat: int) -> dict:
+    html = search_page_html("python-developer", "noida", 1, cards)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        records = parse_jobs_html(html, "http://bench")
+    elapsed = time.perf_counter() - start
+    return {"cards_per_page": len(records), "pages": repeat, "cards_per_s": round(len(records) * repeat / elapsed)}
+
+
+async def bench_scan(site: FakeNaukri, pool: BrowserPool, keywords: list, locations: list) -> dict:
+    timer = StepTimer()
+    found = 0
+    start = time.perf_counter()
+    async with pool.context() as context:
+        async for _ in scan_jobs(context, keywords, locations, base_url=site.base_url, timer=timer, cache=ScanCache()):
+            found += 1
+    elapsed = time.perf_counter() - start
+    return {"jobs": found, "duration_s": round(elapsed, 2), "jobs_per_s": round(found / elapsed, 1), "steps": timer.summary()}
+
+
+async def bench_apply(site: FakeNaukri, pool: BrowserPool, users: int, keywords: str, locations: str) -> dict:
+    timer = StepTimer()
+    limiter = DomainLimiter()
+    with tempfile.TemporaryDirectory() as session_dir:
+        store = SessionStore(directory=session_dir, key=None)
+        start = time.perf_counter()
+        results = await asyncio.gather(*(
+            apply_to_jobs_naukri(
+                username=f"bench-user-{i}@example.com",
+                password="bench",
+                keywords=keywords,
+                location=locations,
+                pool=pool,
+                base_url=site.base_url,
+                limiter=limiter,
+                session_store=store,
+                timer=timer,
+            )
+            for i in range(users)
+        ), return_exceptions=True)
+        elapsed = time.perf_counter() - start
+    failures = [repr(result) for result in results if isinstance(result, Exception)]
+    # Counted by the site, so apply clicks that failed are not included.
+    applied = site.hits["apply"]
+    return {
+        "users": users,
+        "failed_runs": failures,
+        "applications": applied,
+        "duration_s": round(elapsed, 2),
+        "applications_per_s": round(applied / elapsed, 2),
+        "steps": timer.summary(),
+    }
+
+
+async def run(args) -> dict:
+    report = {"config": vars(args).copy(), "parse": bench_parse(args.cards, args.parse_repeat)}
+    keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
+    locations = [l.strip() for l in args.locations.split(",") if l.strip()]
+    with FakeNaukri(latency_ms=args.latency_ms, cards_per_page=args.cards, pages=args.pages) as site:
+        pool = BrowserPool()
+        try:
+            async with RssSampler() as rss:
+                report["scan"] = await bench_scan(site, pool, keywords, locations)
+                report["apply"] = await bench_apply(site, pool, args.users, args.keywords, args.locations)
+        finally:
+            await pool.close()
+    report["peak_rss_mb"] = round(rss.peak_mb, 1)
+    report["browser_launches"] = pool.stats.launches
+    report["browser_pool"] = pool.stats.as_dict()
+    return report
+
+
+def print_report(report: dict):
+    parse, scan, apply = report["parse"], report["scan"], report["apply"]
+    print(f"📄 parse: {parse['cards_per_s']} cards/s")
+    print(f"🔍 scan:  {scan['jobs']} jobs in {scan['duration_s']}s ({scan['jobs_per_s']} jobs/s)")
+    print(f"✅ apply: {apply['applications']} applications by {apply['users']} users in {apply['duration_s']}s "
+          f"= {apply['applications_per_s']} applications/s")
+    if apply["failed_runs"]:
+        print(f"❌ {len(apply['failed_runs'])} runs failed: {apply['failed_runs'][:3]}")
+    print(f"   {'step':<8} {'count':>6} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, step in sorted(apply["steps"].items()):
+        print(f"   {name:<8} {step['count']:>6} {step['p50_ms']:>9} {step['p99_ms']:>9} {step['max_ms']:>9}")
+    print(f"🧠 peak RSS: {report['peak_rss_mb']} MB, 🚀 browser launches: {report['browser_launches']}")
+
+
+def regressions(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Compares throughput and tail latency with a saved report."""
+    found = []
+    old, new = baseline["apply"]["applications_per_s"], report["apply"]["applications_per_s"]
+    if old and new < old * (1 - tolerance):
+        found.append(f"applications/s fell from {old} to {new}")
+    for name, step in report["apply"]["steps"].items():
+        old_step = baseline["apply"]["steps"].get(name)
+        if old_step and step["p99_ms"] > old_step["p99_ms"] * (1 + tolerance):
+            found.append(f"{name} p99 rose from {old_step['p99_ms']} ms to {step['p99_ms']} ms")
+    if report["browser_launches"] > baseline["browser_launches"]:
+        found.append(f"browser launches rose from {baseline['browser_launches']} to {report['browser_launches']}")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the bot against a local Naukri stand-in.")
+    parser.add_argument("--users", type=int, default=4, help="concurrent apply sessions")
+    parser.add_argument("--keywords", default="python developer,data engineer")
+    parser.add_argument("--locations", default="noida")
+    parser.add_argument("--cards", type=int, default=20, help="job cards per result page")
+    parser.add_argument("--pages", type=int, default=2, help="result pages per search")
+    parser.add_argument("--latency-ms", type=float, default=50, help="delay added to every response")
+    parser.add_argument("--parse-repeat", type=int, default=200)
+    parser.add_argument("--save", help="write the report as JSON")
+    parser.add_argument("--baseline", help="compare with a saved report and exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(report, json.load(f), args.tolerance)
+        for line in found:
+            print("📉", line)
+        sys.exit(1 if found else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,87 +1,254 @@
 import asyncio
-from playwright.async_api import async_playwright
+import re
 from datetime import datetime
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from database.crud import log_applied_job
 
 
-from backend.db.models import UserProfile
-from backend.db.database import SessionLocal
-
-async def apply_to_jobs_naukri(username, password, keywords, location="", user_id=None):
-    db = SessionLocal()
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-
-    # Handle blacklist filters
-    blacklist_keywords = profile.blacklisted_keywords.split(",") if profile and profile.blacklisted_keywords else []
-    blacklist_companies = profile.blacklisted_companies.split(",") if profile and profile.blacklisted_companies else []
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)  # True in production
-        context = await browser.new_context()
+from backend.core.config import settings
+from backend.core.metrics import BOT_JOBS
+from backend.core.run_events import RunCancelled
+from bot_engine.blacklist import compile_blacklist
+from bot_engine.browser_pool import get_browser_pool
+from bot_engine.concurrency import goto
+from bot_engine.dedup import AppliedJobIndex
+from bot_engine.profile_cache import get_profile_cache
+from bot_engine.scanner import scan_jobs, split_csv
+from bot_engine.readiness import StepTimer, expect_response, wait_ready
+from bot_engine.session_store import get_session_store
+
+# Readiness signals used instead of fixed sleeps.
+APPLY_BUTTON_SELECTOR = '#apply-button, button[title="Apply"], a[title="Apply"]'
+APPLY_RESPONSE = re.compile(r"/apply", re.IGNORECASE)
+# Naukri's message under the login form for wrong credentials or a locked account.
+LOGIN_ERROR_SELECTOR = ".server-err, .err-container, .erLbl"
+
+
+class LoginFailed(Exception):
+    """
+    Naukri did not accept the credentials. Not worth retrying: every
+    attempt is another failed login against the account.
+    """
+
+
+def _is_login_url(url):
+    return "/login" in url
+
+
+async def _login(page, username, password, base_url, limiter=None):
+    await goto(page, f"{base_url}/mnjuser/login", limiter, wait_until="domcontentloaded")
+    await page.fill('input[name="username"]', username)
+    await page.fill('input[name="password"]', password)
+    await page.click('button[type="submit"]')
+    # Logged in once we have been redirected away from the login page.
+    try:
+        await wait_ready(
+            page,
+            url=lambda url: not _is_login_url(url),
+            load_state="domcontentloaded",
+            timeout_ms=settings.BOT_LOGIN_TIMEOUT_MS,
+        )
+    except PlaywrightTimeoutError as e:
+        banner = page.locator(LOGIN_ERROR_SELECTOR).first
+        reason = "still on the login page"
+        if await banner.count() and await banner.is_visible():
+            reason = " ".join((await banner.inner_text()).split()) or reason
+        raise LoginFailed(f"Naukri login failed for {username}: {reason}") from e
+
+
+async def _session_is_valid(page, base_url, limiter=None):
+    """Opens the logged-in homepage; an expired session bounces to the login page."""
+    try:
+        await goto(page, f"{base_url}/mnjuser/homepage", limiter, wait_until="domcontentloaded")
+    except PlaywrightTimeoutError:
+        return False
+    return not _is_login_url(page.url)
+
+
+async def _apply_in_new_tab(context, job_url, limiter=None):
+    """Opens the job in its own tab, clicks Apply and waits for the apply request."""
+    tab = await context.new_page()
+    try:
+        await goto(tab, job_url, limiter, wait_until="domcontentloaded")
+        await wait_ready(tab, selector=APPLY_BUTTON_SELECTOR)
+        async with expect_response(tab, APPLY_RESPONSE, settings.BOT_APPLY_TIMEOUT_MS):
+            await tab.click(APPLY_BUTTON_SELECTOR)
+    finally:
+        await tab.close()
+
+
+async def apply_to_jobs_naukri(username, password, keywords, location="", user_id=None, pool=None, base_url=None, limiter=None, session_store=None, writer=None, rate_limiter=None, profile=None, timer=None, progress=None):
+    """
+    Logs into Naukri and applies to the jobs found for the given search.
+    `keywords` and `location` may be comma-separated lists (as stored on the
+    Profile); every keyword x location search is scanned across pages.
+
+    The browser comes from `pool` (the worker's shared BrowserPool by default),
+    so each call only pays for a new isolated BrowserContext rather than a
+    full Chromium launch. `base_url` lets the bot run against a local stand-in
+    of the Naukri site. `limiter` is an optional DomainLimiter shared by all
+    sessions on the loop to cap concurrent navigations per host.
+
+    Blocking DB work runs in a thread so many sessions can share one loop.
+    Every step waits for a readiness signal rather than a fixed sleep, and the
+    per-step timings are returned as a dict (see StepTimer.summary); steps
+    and per-job outcomes are also exported as Prometheus metrics. Pass a
+    `timer` to collect the steps of several runs together.
+
+    The authenticated storage_state is cached per Naukri username in
+    `session_store` and reused across runs; the login form is only filled in
+    when there is no cached session or it has expired.
+
+    Jobs the user already applied to are skipped via an AppliedJobIndex
+    preloaded once per run, before any tab is opened for them; the scanner
+    hands them back so they are reported as duplicates. Applications
+    are recorded through `writer` (a WriteBehindWriter) when given, otherwise
+    one row at a time. `rate_limiter` (e.g. ApplicationRateLimiter) is awaited
+    before every application.
+
+    `profile` is the user's CompiledProfile; when omitted it is fetched from
+    the shared ProfileCache, and its precomputed searches and blacklist
+    matchers replace `keywords` and `location`.
+
+    `progress` (a RunProgress) receives an event for every job found,
+    skipped, applied or failed. Its cancel flag is checked between jobs;
+    a cancelled run stops scanning, lets open tabs finish, closes the
+    browser context and raises RunCancelled.
+
+    Errors that abort the whole run are re-raised so callers can retry.
+    """
+    timer = timer or StepTimer(user_id=user_id)
+    pool = pool or get_browser_pool()
+    base_url = (base_url or settings.NAUKRI_BASE_URL).rstrip("/")
+    session_store = session_store or get_session_store()
+    cached_state = await asyncio.to_thread(session_store.load, username)
+
+    if profile is None and user_id:
+        profile = await asyncio.to_thread(get_profile_cache().get, user_id)
+    applied = await asyncio.to_thread(AppliedJobIndex.load, user_id)
+
+    # Handle blacklist filters (compiled with the profile)
+    if profile is not None:
+        searches = profile.searches
+        blacklist_keywords, blacklist_companies = profile.keyword_blacklist, profile.company_blacklist
+    else:
+        searches = None
+        blacklist_keywords = blacklist_companies = compile_blacklist(None)
+
+    context_options = {"storage_state": cached_state} if cached_state else {}
+    async with pool.context(**context_options) as context:
         page = await context.new_page()
 
         try:
-            print("🔐 Logging in...")
-            await page.goto("https://www.naukri.com/mnjuser/login")
-            await page.fill('input[name="username"]', username)
-            await page.fill('input[name="password"]', password)
-            await page.click('button[type="submit"]')
-            await page.wait_for_timeout(5000)
+            async with timer.step("login"):
+                if cached_state and await _session_is_valid(page, base_url, limiter):
+                    print("🔓 Reusing cached session")
+                else:
+                    print("🔐 Logging in...")
+                    await _login(page, username, password, base_url, limiter)
+                    state = await context.storage_state()
+                    await asyncio.to_thread(session_store.save, username, state)
 
             print("🔍 Searching jobs...")
-            search_url = f"https://www.naukri.com/{keywords}-jobs-in-{location}".replace(" ", "-")
-            await page.goto(search_url)
-            await page.wait_for_timeout(5000)
-
-            job_cards = await page.query_selector_all('article.jobTuple')
-            print(f"🔎 Found {len(job_cards)} jobs")
-
-            for job in job_cards:
+            # Each job gets its own tab in this context, a few at a time. Jobs
+            # are applied to as the scanner streams them in, and the scanner
+            # waits whenever every tab is busy.
+            tabs = asyncio.Semaphore(settings.BOT_APPLY_TABS)
+            pending = set()
+
+            async def report(outcome, job, reason=""):
+                BOT_JOBS.labels(outcome=f"{outcome}_{reason}" if reason else outcome).inc()
+                if progress is not None:
+                    await asyncio.to_thread(progress.job, outcome, job.title, job.company, job.url, reason)
+
+            async def apply_in_tab(job):
                 try:
-                    job_title_elem = await job.query_selector("a.title")
-                    company_elem = await job.query_selector("a.subTitle")
-
-                    job_title_text = await job_title_elem.inner_text() if job_title_elem else "Unknown Title"
-                    company_text = await company_elem.inner_text() if company_elem else "Unknown Company"
-
+                    if progress is not None and await asyncio.to_thread(progress.is_cancelled):
+                        return
+                    if rate_limiter is not None:
+                        await rate_limiter.acquire()
+                    async with timer.step("apply"):
+                        await _apply_in_new_tab(context, job.url, limiter)
+                    print("✅ Applied to:", job.title)
+                    await report("applied", job)
+
+                    # Log to database
+                    if user_id:
+                        async with timer.step("db_log"):
+                            if writer is not None:
+                                await writer.add_applied(user_id, job.title, job.company, job.url)
+                            else:
+                                await asyncio.to_thread(log_applied_job, user_id, job.title, job.company, job.url)
+                except Exception as e:
+                    print("⚠️ Error processing job:", e)
+                    await report("error", job)
+                finally:
+                    tabs.release()
+
+            async def skip_duplicate(job):
+                await report("skipped", job, "duplicate")
+
+            try:
+                found = 0
+                async for job in scan_jobs(context, split_csv(keywords), split_csv(location), seen=applied, limiter=limiter, base_url=base_url, timer=timer, searches=searches, on_seen=skip_duplicate):
+                    found += 1
+                    if progress is not None:
+                        await asyncio.to_thread(progress.raise_if_cancelled)
                     # Skip if blacklisted
-                    if any(b.lower() in job_title_text.lower() for b in blacklist_keywords):
-                        print(f"⛔ Skipping due to blacklisted keyword: {job_title_text}")
+                    rule = blacklist_keywords.match(job.title)
+                    if rule:
+                        print(f"⛔ Skipping due to blacklisted keyword '{rule}': {job.title}")
+                        await report("skipped", job, "blacklist")
                         continue
-                    if any(c.lower() in company_text.lower() for c in blacklist_companies):
-                        print(f"⛔ Skipping blacklisted company: {company_text}")
+                    rule = blacklist_companies.match(job.company)
+                    if rule:
+                        print(f"⛔ Skipping blacklisted company '{rule}': {job.company}")
+                        await report("skipped", job, "blacklist")
+                        continue
+                    if not job.can_apply:
+                        await report("skipped", job, "unavailable")
                         continue
 
-                    apply_btn = await job.query_selector('a[title="Apply"]')
-                    if apply_btn:
-                        job_url = await job.get_attribute("data-url")
-                        await apply_btn.click()
-                        await page.wait_for_timeout(3000)
-                        print("✅ Applied to:", job_title_text)
-
-                        # Log to database
-                        if user_id:
-                            log_applied_job(user_id, job_title_text, company_text, job_url)
-
-                        await page.go_back()
-                        await page.wait_for_timeout(2000)
-                except Exception as e:
-                    print("⚠️ Error processing job:", e)
-                    continue
-
+                    applied.add(job.url)
+                    if progress is not None:
+                        await asyncio.to_thread(progress.job, "queued", job.title, job.company, job.url)
+                    await tabs.acquire()
+                    task = asyncio.create_task(apply_in_tab(job))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                print(f"🔎 Found {found} jobs")
+            finally:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        except RunCancelled:
+            print("🛑 Run cancelled")
+            raise
+        except LoginFailed as e:
+            print("🔒", e)
+            raise
         except Exception as e:
             print("❌ Bot failed:", e)
-        finally:
-            await context.close()
-            await browser.close()
-            db.close()
+            raise
+
+    timings = timer.summary()
+    print("⏱️ Step timings:", timings)
+    return timings
 
 # Test Run (Optional)
 if __name__ == "__main__":
-    asyncio.run(apply_to_jobs_naukri(
-        username="your_email@example.com",
-        password="your_password",
-        keywords="python developer",
-        location="noida",
-        user_id=1  # Pass your test user_id
-    ))
+    from bot_engine.browser_pool import close_browser_pool
+
+    async def _test_run():
+        try:
+            await apply_to_jobs_naukri(
+                username="your_email@example.com",
+                password="your_password",
+                keywords="python developer",
+                location="noida",
+                user_id=1  # Pass your test user_id
+            )
+            print("📊 Browser pool:", get_browser_pool().stats.as_dict())
+        finally:
+            await close_browser_pool()
+
+    asyncio.run(_test_run())
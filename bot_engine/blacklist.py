@@ -0,0 +1,65 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from backend.core.config import settings
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: Optional[str]) -> str:
+    """Case-folds, applies NFKC and collapses runs of whitespace."""
+    text = unicodedata.normalize("NFKC", text or "")
+    return _WHITESPACE.sub(" ", text).strip().casefold()
+
+
+class BlacklistMatcher:
+    """
+    Matches text against every blacklist entry with one combined regex.
+
+    Entries and text are normalized the same way, so " Infosys" matches
+    "INFOSYS Ltd". With `word_boundary` an entry only matches whole words
+    ("java" does not match "javascript"); lookarounds are used instead of \\b
+    so entries such as "c++" or ".net" still work.
+    """
+
+    def __init__(self, entries: Iterable[str], word_boundary: bool = True):
+        self.word_boundary = word_boundary
+        # normalized entry -> entry as the user wrote it (for reporting)
+        self._rules = {}
+        for entry in entries:
+            key = normalize(entry)
+            if key and key not in self._rules:
+                self._rules[key] = entry.strip()
+
+        self._pattern = None
+        if self._rules:
+            # Longest first, so the most specific rule is the one reported.
+            alternatives = "|".join(re.escape(key) for key in sorted(self._rules, key=len, reverse=True))
+            if word_boundary:
+                alternatives = rf"(?<!\w)(?:{alternatives})(?!\w)"
+            self._pattern = re.compile(alternatives)
+
+    def __bool__(self) -> bool:
+        return self._pattern is not None
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def match(self, text: Optional[str]) -> Optional[str]:
+        """Returns the blacklist entry that matched `text`, or None."""
+        if self._pattern is None or not text:
+            return None
+        found = self._pattern.search(normalize(text))
+        return self._rules[found.group(0)] if found else None
+
+
+@lru_cache(maxsize=4096)
+def compile_blacklist(raw: Optional[str], word_boundary: bool = settings.BLACKLIST_WORD_BOUNDARY) -> BlacklistMatcher:
+    """
+    Builds a matcher from a comma-separated Profile field. Results are cached
+    on the raw string, so a matcher is compiled once per distinct blacklist
+    and a changed profile simply gets a new one.
+    """
+    return BlacklistMatcher((raw or "").split(","), word_boundary=word_boundary)
@@ -0,0 +1,258 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+from playwright.async_api import async_playwright
+
+from backend.core.config import settings
+from backend.core.metrics import BROWSER_CONTEXTS_IN_FLIGHT, BROWSER_LAUNCHES, BROWSER_RECYCLES, BROWSERS_OPEN
+
+
+@dataclass
+class PoolStats:
+    launches: int = 0
+    recycles: int = 0
+    contexts_created: int = 0
+    contexts_in_flight: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Contexts served per browser launch (1.0 means no reuse at all)."""
+        return self.contexts_created / self.launches if self.launches else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "launches": self.launches,
+            "recycles": self.recycles,
+            "contexts_created": self.contexts_created,
+            "contexts_in_flight": self.contexts_in_flight,
+            "reuse_ratio": round(self.reuse_ratio, 2),
+        }
+
+
+class _PooledBrowser:
+    def __init__(self, browser):
+        self.browser = browser
+        self.contexts_served = 0
+        self.in_flight = 0
+        self.retiring = False
+
+
+def _children_rss_mb() -> Optional[float]:
+    """
+    Returns the resident memory (in MB) of all child processes of this worker,
+    which is where Playwright's driver and Chromium live. Linux only; returns
+    None where /proc is not available.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    parent_of = {}
+    rss_kb = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/status") as f:
+                for line in f:
+                    if line.startswith("PPid:"):
+                        parent_of[int(entry)] = int(line.split()[1])
+                    elif line.startswith("VmRSS:"):
+                        rss_kb[int(entry)] = int(line.split()[1])
+        except (OSError, ValueError):
+            continue
+
+    descendants = {os.getpid()}
+    changed = True
+    while changed:
+        changed = False
+        for pid, ppid in parent_of.items():
+            if ppid in descendants and pid not in descendants:
+                descendants.add(pid)
+                changed = True
+    descendants.discard(os.getpid())
+    return sum(rss_kb.get(pid, 0) for pid in descendants) / 1024
+
+
+class BrowserPool:
+    """
+    A long-lived pool of Chromium browsers owned by the worker process.
+
+    Each user run gets its own isolated BrowserContext (separate cookies and
+    storage) from a shared browser, instead of paying a full Chromium launch.
+    A browser is retired once it has served `max_contexts_per_browser`
+    contexts, or while idle once the browser processes exceed `max_rss_mb`;
+    it is closed as soon as its last in-flight context is released. No more
+    than `size` browsers are ever open, retiring ones included: when every
+    slot is taken by a retiring browser, callers wait for one to close.
+    """
+
+    def __init__(
+        self,
+        size: int = settings.BROWSER_POOL_SIZE,
+        max_contexts_per_browser: int = settings.BROWSER_MAX_CONTEXTS,
+        max_rss_mb: Optional[int] = settings.BROWSER_MAX_RSS_MB,
+        headless: bool = settings.BROWSER_HEADLESS,
+        rss_sample_seconds: float = settings.BROWSER_RSS_SAMPLE_SECONDS,
+    ):
+        self.size = size
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self.max_rss_mb = max_rss_mb
+        self.headless = headless
+        self.rss_sample_seconds = rss_sample_seconds
+        self._rss_mb: Optional[float] = None
+        self._rss_sampled_at: Optional[float] = None
+        self.stats = PoolStats()
+        self._playwright = None
+        self._browsers: list[_PooledBrowser] = []
+        self._lock = asyncio.Lock()
+        self._released = asyncio.Condition(self._lock)
+
+    async def start(self):
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+    async def close(self):
+        async with self._lock:
+            for pooled in self._browsers:
+                await pooled.browser.close()
+            BROWSERS_OPEN.dec(len(self._browsers))
+            self._browsers.clear()
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def _launch(self) -> _PooledBrowser:
+        browser = await self._playwright.chromium.launch(headless=self.headless)
+        self.stats.launches += 1
+        BROWSER_LAUNCHES.inc()
+        BROWSERS_OPEN.inc()
+        pooled = _PooledBrowser(browser)
+        self._browsers.append(pooled)
+        return pooled
+
+    async def _retire(self, pooled: _PooledBrowser):
+        pooled.retiring = True
+        if pooled.in_flight == 0:
+            self._browsers.remove(pooled)
+            self.stats.recycles += 1
+            BROWSER_RECYCLES.inc()
+            BROWSERS_OPEN.dec()
+            await pooled.browser.close()
+
+    async def _sample_rss(self):
+        """
+        Refreshes the browsers' memory reading if it is older than
+        `rss_sample_seconds`. The /proc walk runs in a thread, outside the
+        pool lock, so it never holds up the event loop or other checkouts.
+        """
+        if not self.max_rss_mb:
+            return
+        now = time.monotonic()
+        if self._rss_sampled_at is not None and now - self._rss_sampled_at < self.rss_sample_seconds:
+            return
+        self._rss_sampled_at = now
+        self._rss_mb = await asyncio.to_thread(_children_rss_mb)
+
+    def _over_memory_ceiling(self) -> bool:
+        """Compares the last sampled reading with the ceiling."""
+        if not self.max_rss_mb:
+            return False
+        return self._rss_mb is not None and self._rss_mb > self.max_rss_mb
+
+    async def _acquire_browser(self) -> _PooledBrowser:
+        await self._sample_rss()
+        async with self._released:
+            await self.start()
+            while True:
+                for pooled in list(self._browsers):
+                    if not pooled.browser.is_connected() and pooled.in_flight == 0:
+                        self._browsers.remove(pooled)
+                        BROWSERS_OPEN.dec()
+
+                over_ceiling = self._over_memory_ceiling()
+                if over_ceiling:
+                    # Only idle browsers can go now; busy ones keep serving
+                    # their contexts, and retiring ones are already on their way out.
+                    idle = [b for b in self._browsers if not b.retiring and b.in_flight == 0]
+                    for pooled in idle:
+                        await self._retire(pooled)
+                    if idle:
+                        # Memory was freed; take a fresh reading on the next checkout.
+                        self._rss_sampled_at = None
+
+                # Retiring browsers count towards `size` until they close.
+                live = [b for b in self._browsers if not b.retiring and b.browser.is_connected()]
+                if len(self._browsers) < self.size and not (over_ceiling and live):
+                    pooled = await self._launch()
+                    break
+                if live:
+                    # Spread contexts across the browsers we already have.
+                    pooled = min(live, key=lambda b: b.in_flight)
+                    break
+                # Every slot is held by a retiring browser still serving a
+                # context; wait for one to be released and closed.
+                await self._released.wait()
+
+            pooled.contexts_served += 1
+            pooled.in_flight += 1
+            if pooled.contexts_served >= self.max_contexts_per_browser:
+                pooled.retiring = True
+            return pooled
+
+    async def _release_browser(self, pooled: _PooledBrowser):
+        async with self._released:
+            pooled.in_flight -= 1
+            if pooled.retiring and pooled in self._browsers:
+                await self._retire(pooled)
+            self._released.notify_all()
+
+    @asynccontextmanager
+    async def context(self, **context_options):
+        """
+        Yields a fresh BrowserContext on a pooled browser and closes it on exit.
+        Keyword arguments are passed straight to `browser.new_context()`.
+        """
+        pooled = await self._acquire_browser()
+        self.stats.contexts_created += 1
+        self.stats.contexts_in_flight += 1
+        BROWSER_CONTEXTS_IN_FLIGHT.inc()
+        context = None
+        try:
+            context = await pooled.browser.new_context(**context_options)
+            yield context
+        finally:
+            if context is not None:
+                await context.close()
+            self.stats.contexts_in_flight -= 1
+            BROWSER_CONTEXTS_IN_FLIGHT.dec()
+            await self._release_browser(pooled)
+
+
+_shared_pool: Optional[BrowserPool] = None
+_shared_pool_loop = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Returns the process-wide browser pool, creating it on first use.
+    Playwright objects are bound to the event loop that created them, so a
+    new pool is created if the caller is running on a different loop.
+    """
+    global _shared_pool, _shared_pool_loop
+    loop = asyncio.get_running_loop()
+    if _shared_pool is None or _shared_pool_loop is not loop:
+        _shared_pool = BrowserPool()
+        _shared_pool_loop = loop
+    return _shared_pool
+
+
+async def close_browser_pool():
+    """Shuts down the process-wide pool (call when the worker exits)."""
+    global _shared_pool, _shared_pool_loop
+    if _shared_pool is not None:
+        await _shared_pool.close()
+        _shared_pool = None
+        _shared_pool_loop = None
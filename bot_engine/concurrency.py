@@ -0,0 +1,35 @@
+import asyncio
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+from backend.core.config import settings
+
+
+class DomainLimiter:
+    """
+    Caps how many navigations may be in flight against one host at a time,
+    shared by every user session running on the same event loop.
+    """
+
+    def __init__(self, per_domain: int = settings.BOT_MAX_CONCURRENT_PER_DOMAIN):
+        self.per_domain = per_domain
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.per_domain)
+        return self._semaphores[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        async with self._semaphore(url):
+            yield
+
+
+async def goto(page, url: str, limiter: DomainLimiter = None, **kwargs):
+    """`page.goto` that waits for a free per-domain slot when a limiter is given."""
+    if limiter is None:
+        return await page.goto(url, **kwargs)
+    async with limiter.slot(url):
+        return await page.goto(url, **kwargs)
@@ -0,0 +1,25 @@
+from database.crud import get_applied_links
+
+
+class AppliedJobIndex:
+    """
+    In-memory set of the job links a user has applied to, loaded once per run
+    so "already applied?" is an O(1) lookup instead of a DB query, and is
+    answered before the bot spends any navigation on the job.
+    """
+
+    def __init__(self, links=()):
+        self._links = set(links)
+
+    @classmethod
+    def load(cls, user_id):
+        return cls(get_applied_links(user_id) if user_id else ())
+
+    def __contains__(self, job_link):
+        return job_link in self._links
+
+    def __len__(self):
+        return len(self._links)
+
+    def add(self, job_link):
+        self._links.add(job_link)
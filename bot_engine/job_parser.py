@@ -1 +1,196 @@
 # Extract info from job listings
+#
+# The same card layout is read two ways: `extract_jobs` runs one evaluation
+# inside a live Playwright page, and `parse_jobs_html` parses saved HTML
+# offline (for fixtures and benchmarks). Both return JobRecord objects.
+
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass
+from html.parser import HTMLParser
+from typing import Optional
+from urllib.parse import urljoin
+
+JOB_CARD_SELECTOR = "article.jobTuple"
+
+# field -> (tag or None for any tag, CSS classes that identify it)
+_FIELD_RULES = {
+    "title": ("a", ("title",)),
+    "company": ("a", ("subTitle",)),
+    "location": (None, ("location", "locWdth")),
+    "experience": (None, ("experience", "expwdth")),
+    "salary": (None, ("salary", "sal")),
+    "posted": (None, ("postedDate", "job-post-day")),
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True, slots=True)
+class JobRecord:
+    title: str
+    company: str
+    url: Optional[str]
+    location: str = ""
+    experience: str = ""
+    salary: str = ""
+    posted: str = ""
+    job_id: Optional[str] = None
+    can_apply: bool = False
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _clean(text: Optional[str]) -> str:
+    return _WHITESPACE.sub(" ", text or "").strip()
+
+
+def _to_record(raw: dict, base_url: Optional[str]) -> JobRecord:
+    url = raw.get("url") or None
+    if url and base_url:
+        url = urljoin(base_url, url)
+    return JobRecord(
+        title=_clean(raw.get("title")) or "Unknown Title",
+        company=_clean(raw.get("company")) or "Unknown Company",
+        url=url,
+        location=_clean(raw.get("location")),
+        experience=_clean(raw.get("experience")),
+        salary=_clean(raw.get("salary")),
+        posted=_clean(raw.get("posted")),
+        job_id=raw.get("job_id") or None,
+        can_apply=bool(raw.get("can_apply")),
+    )
+
+
+def _field_selector(tag, classes):
+    return ", ".join(f"{tag or ''}.{cls}" for cls in classes)
+
+
+# Built from _FIELD_RULES so the in-page and offline parsers cannot drift apart.
+_EXTRACT_JS = """
+([cardSelector, fields]) => Array.from(document.querySelectorAll(cardSelector), card => {
+    const out = {
+        url: card.getAttribute("data-url") || card.querySelector("a.title")?.getAttribute("href") || null,
+        job_id: card.getAttribute("data-job-id"),
+        can_apply: !!card.querySelector('a[title="Apply"]'),
+    };
+    for (const [name, selector] of fields) {
+        out[name] = card.querySelector(selector)?.textContent || "";
+    }
+    return out;
+})
+"""
+_FIELD_SELECTORS = [[name, _field_selector(tag, classes)] for name, (tag, classes) in _FIELD_RULES.items()]
+
+
+async def extract_jobs(page) -> list[JobRecord]:
+    """
+    Pulls every job card on the current page in a single in-page evaluation
+    (one CDP round trip, however many cards there are).
+    """
+    raw_cards = await page.evaluate(_EXTRACT_JS, [JOB_CARD_SELECTOR, _FIELD_SELECTORS])
+    return [_to_record(raw, page.url) for raw in raw_cards]
+
+
+class _CardParser(HTMLParser):
+    """
+    Collects `article.jobTuple` cards from result-page HTML. Real pages
+    leave tags such as <p> and <li> unclosed, so open elements are kept on a
+    stack and an end tag closes everything still open inside it, the way a
+    browser would; `</article>` always ends the current card, and a card
+    still open when the page ends is kept.
+    """
+
+    _VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cards = []
+        self._card = None
+        self._open = []
+        self._card_depth = None
+        # field name -> depth at which its element was opened
+        self._capturing = {}
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = set((attrs.get("class") or "").split())
+        if tag not in self._VOID_TAGS:
+            self._open.append(tag)
+        depth = len(self._open)
+
+        if self._card is None:
+            if tag == "article" and "jobTuple" in classes:
+                self._card = {
+                    "url": attrs.get("data-url"),
+                    "job_id": attrs.get("data-job-id"),
+                    "can_apply": False,
+                }
+                self._card_depth = depth
+            return
+
+        if tag == "a" and attrs.get("title") == "Apply":
+            self._card["can_apply"] = True
+        for name, (rule_tag, rule_classes) in _FIELD_RULES.items():
+            if name in self._card or name in self._capturing:
+                continue
+            if (rule_tag is None or rule_tag == tag) and classes.intersection(rule_classes):
+                self._capturing[name] = depth
+                self._card[name] = ""
+                if name == "title" and not self._card["url"]:
+                    self._card["url"] = attrs.get("href")
+
+    def handle_endtag(self, tag):
+        if tag not in self._open:
+            # Void or stray end tag: nothing to close.
+            return
+        while True:
+            self._close_element(len(self._open))
+            if self._open.pop() == tag:
+                return
+
+    def _close_element(self, depth):
+        if self._card is None:
+            return
+        for name, field_depth in list(self._capturing.items()):
+            if field_depth >= depth:
+                del self._capturing[name]
+        if depth == self._card_depth:
+            self.cards.append(self._card)
+            self._card = None
+            self._capturing.clear()
+
+    def handle_data(self, data):
+        for name in self._capturing:
+            self._card[name] += data
+
+    def close(self):
+        super().close()
+        # A truncated page can end inside a card; keep what was read of it.
+        if self._card is not None:
+            self._close_element(self._card_depth)
+
+
+def parse_jobs_html(html: str, base_url: Optional[str] = None) -> list[JobRecord]:
+    """Offline equivalent of `extract_jobs` for saved result-page HTML."""
+    parser = _CardParser()
+    parser.feed(html)
+    parser.close()
+    return [_to_record(raw, base_url) for raw in parser.cards]
+
+
+# Benchmark over saved pages (Optional):
+#   python -m bot_engine.job_parser saved_page.html [more.html ...]
+#   python -m bot_engine.job_parser bench/fixtures/unclosed_tags.html   # 3 jobs
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        start = time.perf_counter()
+        records = parse_jobs_html(html)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"📄 {path}: {len(records)} jobs parsed in {elapsed_ms:.2f} ms")
+        for record in records[:3]:
+            print("   ", record.as_dict())
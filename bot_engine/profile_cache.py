@@ -0,0 +1,165 @@
+import json
+import threading
+from dataclasses import dataclass, field, fields
+from typing import Iterable, Optional
+
+from redis.exceptions import RedisError
+
+from backend.core.config import settings
+from backend.core.redis_client import get_redis
+from backend.db.database import SessionLocal
+from backend.db.models import Profile
+from bot_engine.blacklist import BlacklistMatcher, compile_blacklist
+from bot_engine.scanner import scan_key, split_csv
+from bot_engine.scoring import ProfileQuery
+
+
+def _unique(values) -> tuple[str, ...]:
+    """Drops case-insensitive duplicates, keeping the first spelling."""
+    seen = {}
+    for value in split_csv(values):
+        seen.setdefault(value.lower(), value)
+    return tuple(seen.values())
+
+
+@dataclass
+class CompiledProfile:
+    """
+    A Profile parsed once for the bot, scanner and scorer: normalized lists,
+    compiled blacklist matchers, the searches to scan and the scoring query.
+
+    The Naukri password is never part of the cached payload; it is read
+    fresh with the version check on every lookup.
+    """
+    user_id: int
+    version: int
+    naukri_username: Optional[str]
+    keywords: tuple[str, ...]
+    locations: tuple[str, ...]
+    blacklisted_keywords: str
+    blacklisted_companies: str
+    ctc: Optional[str] = None
+    notice_period: Optional[str] = None
+    resume_path: Optional[str] = None
+    naukri_password: Optional[str] = field(default=None, repr=False, compare=False)
+
+    keyword_blacklist: BlacklistMatcher = field(init=False, repr=False, compare=False)
+    company_blacklist: BlacklistMatcher = field(init=False, repr=False, compare=False)
+    searches: tuple[tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+    query: ProfileQuery = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.keywords = _unique(self.keywords)
+        self.locations = _unique(self.locations)
+        self.keyword_blacklist = compile_blacklist(self.blacklisted_keywords)
+        self.company_blacklist = compile_blacklist(self.blacklisted_companies)
+        # Keyword x location pairs, minus those that map to the same search URL.
+        searches = {}
+        for keyword in self.keywords:
+            for location in self.locations or ("",):
+                searches.setdefault(scan_key(keyword, location), (keyword, location))
+        self.searches = tuple(searches.values())
+        self.query = ProfileQuery.from_profile(self)
+
+    @classmethod
+    def from_model(cls, profile: Profile) -> "CompiledProfile":
+        return cls(
+            user_id=profile.owner_id,
+            version=profile.version,
+            naukri_username=profile.naukri_username,
+            keywords=profile.keywords,
+            locations=profile.locations,
+            blacklisted_keywords=profile.blacklisted_keywords or "",
+            blacklisted_companies=profile.blacklisted_companies or "",
+            ctc=profile.ctc,
+            notice_period=profile.notice_period,
+            resume_path=profile.resume_path,
+            naukri_password=profile.naukri_password,
+        )
+
+    def to_json(self) -> str:
+        """The raw inputs only; derived fields are rebuilt on load."""
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.init and f.name != "naukri_password"}
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str, naukri_password: Optional[str] = None) -> "CompiledProfile":
+        return cls(**json.loads(raw), naukri_password=naukri_password)
+
+
+class ProfileCache:
+    """
+    Two-level cache of CompiledProfile per user: in-process, then Redis.
+
+    Every lookup first reads each profile's `version` (bumped by SQLAlchemy
+    on every profile update) together with the credentials, in one small
+    query. A cached entry is used only if its version matches, so an edited
+    profile is recompiled on its next use everywhere. Redis errors just
+    fall back to compiling from the database.
+    """
+
+    def __init__(self, ttl_seconds: int = settings.PROFILE_CACHE_TTL_SECONDS, session_factory=SessionLocal):
+        self.ttl_seconds = ttl_seconds
+        self.session_factory = session_factory
+        self._local: dict[int, CompiledProfile] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _redis_key(user_id: int, version: int) -> str:
+        return f"profile:{user_id}:v{version}"
+
+    def _from_redis(self, user_id, version, password):
+        try:
+            raw = get_redis().get(self._redis_key(user_id, version))
+        except RedisError:
+            return None
+        return CompiledProfile.from_json(raw, naukri_password=password) if raw else None
+
+    def _to_redis(self, compiled: CompiledProfile):
+        try:
+            get_redis().set(self._redis_key(compiled.user_id, compiled.version), compiled.to_json(), ex=self.ttl_seconds)
+        except RedisError:
+            pass
+
+    def get_many(self, user_ids: Iterable[int]) -> dict[int, CompiledProfile]:
+        """Returns user_id -> CompiledProfile for every user that has a profile."""
+        user_ids = list(user_ids)
+        db = self.session_factory()
+        try:
+            current = db.query(Profile.owner_id, Profile.version, Profile.naukri_password).filter(Profile.owner_id.in_(user_ids)).all()
+            result, missing = {}, []
+            for user_id, version, password in current:
+                with self._lock:
+                    compiled = self._local.get(user_id)
+                if compiled is None or compiled.version != version:
+                    compiled = self._from_redis(user_id, version, password)
+                    if compiled is None:
+                        missing.append(user_id)
+                        continue
+                compiled.naukri_password = password
+                result[user_id] = compiled
+
+            if missing:
+                for profile in db.query(Profile).filter(Profile.owner_id.in_(missing)).all():
+                    compiled = CompiledProfile.from_model(profile)
+                    self._to_redis(compiled)
+                    result[profile.owner_id] = compiled
+        finally:
+            db.close()
+
+        with self._lock:
+            self._local.update(result)
+        return result
+
+    def get(self, user_id: int) -> Optional[CompiledProfile]:
+        return self.get_many([user_id]).get(user_id)
+
+
+_shared_cache: Optional[ProfileCache] = None
+
+
+def get_profile_cache() -> ProfileCache:
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ProfileCache()
+    return _shared_cache
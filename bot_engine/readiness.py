@@ -0,0 +1,104 @@
+import logging
+import math
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+from backend.core.config import settings
+from backend.core.metrics import BOT_STEP_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class StepTimer:
+    """
+    Collects wall-clock durations for each named step of a bot run, so we can
+    see whether login, search or the apply clicks dominate.
+
+    Every step is also observed in the `naukri_bot_step_seconds` histogram
+    and logged at DEBUG level with `labels` (e.g. the user id) attached.
+    """
+
+    def __init__(self, **labels):
+        self.durations = defaultdict(list)
+        self.labels = labels
+
+    @asynccontextmanager
+    async def step(self, name: str):
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.durations[name].append(elapsed)
+            BOT_STEP_SECONDS.labels(step=name).observe(elapsed)
+            logger.debug("step=%s duration_ms=%.1f failed=%s %s", name, elapsed * 1000, failed,
+                         " ".join(f"{key}={value}" for key, value in self.labels.items()))
+
+    def summary(self) -> dict:
+        """Returns {step: {"count", "total_s", "avg_ms", "p50_ms", "p99_ms", "max_ms"}}."""
+        out = {}
+        for name, values in self.durations.items():
+            ordered = sorted(values)
+            out[name] = {
+                "count": len(values),
+                "total_s": round(sum(values), 3),
+                "avg_ms": round(1000 * sum(values) / len(values), 1),
+                "p50_ms": round(1000 * _percentile(ordered, 0.50), 1),
+                "p99_ms": round(1000 * _percentile(ordered, 0.99), 1),
+                "max_ms": round(1000 * ordered[-1], 1),
+            }
+        return out
+
+
+def _percentile(ordered: list, q: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class _Budget:
+    """One timeout shared by several consecutive waits."""
+
+    def __init__(self, timeout_ms: int):
+        self.deadline = time.monotonic() + timeout_ms / 1000
+
+    def remaining_ms(self) -> float:
+        # Playwright treats 0 as "no timeout", so never hand it a zero.
+        return max(1.0, (self.deadline - time.monotonic()) * 1000)
+
+
+async def wait_ready(page, *, url=None, load_state=None, selector=None, timeout_ms: int = settings.BOT_READY_TIMEOUT_MS):
+    """
+    Returns as soon as the page is ready, instead of sleeping a fixed time.
+
+    Any combination of signals can be given and they are awaited in order,
+    all within one `timeout_ms` budget:
+        url:        a glob, regex or predicate the page URL must match.
+        load_state: "load", "domcontentloaded" or "networkidle".
+        selector:   a CSS selector that must become visible.
+
+    Raises playwright's TimeoutError if the budget runs out.
+    """
+    budget = _Budget(timeout_ms)
+    if url is not None:
+        await page.wait_for_url(url, timeout=budget.remaining_ms())
+    if load_state is not None:
+        await page.wait_for_load_state(load_state, timeout=budget.remaining_ms())
+    if selector is not None:
+        await page.wait_for_selector(selector, timeout=budget.remaining_ms())
+
+
+def expect_response(page, url_pattern, timeout_ms: int = settings.BOT_READY_TIMEOUT_MS):
+    """
+    Context manager that waits for a response whose URL matches `url_pattern`
+    (glob, regex or predicate). Enter it *before* the action that triggers the
+    request, e.g.:
+
+        async with expect_response(page, APPLY_RESPONSE):
+            await button.click()
+    """
+    return page.expect_response(url_pattern, timeout=timeout_ms)
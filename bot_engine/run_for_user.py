@@ -1,21 +1,165 @@
 import asyncio
 from bot_engine.apply_bot import apply_to_jobs_naukri
-from backend.db.database import SessionLocal
-from backend.db.models import User, UserProfile
+from bot_engine.browser_pool import BrowserPool
+from bot_engine.concurrency import DomainLimiter
+from bot_engine.profile_cache import get_profile_cache
+from bot_engine.scanner import scan_jobs
+from bot_engine.scoring import JobScorer
+from bot_engine.worker_loop import run_with_browser_pool
+from database.crud import get_recommended_links
+from backend.core.config import settings
+from backend.db.writer import WriteBehindWriter
+
+
+async def run_bots_async(
+    user_ids,
+    max_concurrency=settings.BOT_MAX_CONCURRENT_USERS,
+    per_domain_limit=settings.BOT_MAX_CONCURRENT_PER_DOMAIN,
+    pool=None,
+    rate_limiter=None,
+    progress=None,
+):
+    """
+    Drives the apply sessions of several users concurrently on the current
+    event loop. At most `max_concurrency` users run at once, and navigations
+    to any single host are capped at `per_domain_limit`.
+
+    Applications from every session are written through one shared
+    WriteBehindWriter, which is flushed before this returns. `progress`
+    maps user ids to the RunProgress their run reports to; applications
+    whose history rows the writer could not save are reported to it as
+    lost rows (and printed either way).
+
+    Returns a dict of user_id -> the run's step timings, None if the user
+    has no profile, or the exception the run raised.
+    """
+    profiles = await asyncio.to_thread(get_profile_cache().get_many, list(user_ids))
+    limiter = DomainLimiter(per_domain_limit)
+    slots = asyncio.Semaphore(max_concurrency)
+    owns_pool = pool is None
+    pool = pool or BrowserPool()
+    writer = WriteBehindWriter()
+
+    async def run_one(user_id):
+        profile = profiles.get(user_id)
+        if not profile:
+            print(f"❌ No profile found for user {user_id}")
+            return None
+        async with slots:
+            return await apply_to_jobs_naukri(
+                username=profile.naukri_username,
+                password=profile.naukri_password,
+                keywords=profile.keywords,
+                location=profile.locations,
+                user_id=user_id,
+                pool=pool,
+                limiter=limiter,
+                writer=writer,
+                rate_limiter=rate_limiter,
+                profile=profile,
+                progress=(progress or {}).get(user_id),
+            )
+
+    try:
+        async with writer:
+            results = await asyncio.gather(*(run_one(user_id) for user_id in user_ids), return_exceptions=True)
+    finally:
+        if owns_pool:
+            await pool.close()
+    print("💾 DB writer:", writer.stats.as_dict())
+    for user_id, lost in writer.stats.lost_rows_by_user.items():
+        print(f"❌ {lost} applied jobs of user {user_id} could not be saved")
+        if user_id in (progress or {}):
+            await asyncio.to_thread(progress[user_id].rows_lost, lost)
+
+    outcome = {}
+    for user_id, result in zip(user_ids, results):
+        if isinstance(result, Exception):
+            print(f"❌ Bot run failed for user {user_id}: {result}")
+        outcome[user_id] = result
+    return outcome
+
+
+def run_bots_for_users(user_ids, **kwargs):
+    """
+    Synchronous entry point for a batch of users. In a Celery worker the
+    batch runs on the process's persistent loop and browser pool (see
+    worker_loop); elsewhere it gets an event loop of its own.
+    """
+    return run_with_browser_pool(run_bots_async, user_ids, **kwargs)
+
+
+async def scan_recommendations_async(
+    user_ids,
+    max_concurrency=settings.BOT_MAX_CONCURRENT_USERS,
+    per_domain_limit=settings.BOT_MAX_CONCURRENT_PER_DOMAIN,
+    pool=None,
+):
+    """
+    Scans the searches of several users concurrently (no login needed), then
+    ranks every job found against every one of these users' profiles in one
+    vectorized JobScorer pass. Each user's best new, non-blacklisted matches
+    are stored as RecommendedJobs with the keyword that scored highest as
+    `matched_keyword`. Overlapping searches are fetched once thanks to the
+    shared scan cache, and a job found by one user's search can be
+    recommended to another user it fits.
+
+    Returns a dict of user_id -> number of new recommendations saved, None
+    if the user has no profile, or the exception the scan raised.
+    """
+    profiles = await asyncio.to_thread(get_profile_cache().get_many, list(user_ids))
+    limiter = DomainLimiter(per_domain_limit)
+    slots = asyncio.Semaphore(max_concurrency)
+    owns_pool = pool is None
+    pool = pool or BrowserPool()
+    known = {}
+    found_jobs = {}
+
+    async def scan_one(user_id):
+        profile = profiles.get(user_id)
+        if not profile:
+            return None
+        known[user_id] = await asyncio.to_thread(get_recommended_links, user_id)
+        async with slots, pool.context() as context:
+            async for job in scan_jobs(context, (), searches=profile.searches, seen=known[user_id], limiter=limiter):
+                found_jobs.setdefault(job.url, job)
+        return 0
+
+    try:
+        results = await asyncio.gather(*(scan_one(user_id) for user_id in user_ids), return_exceptions=True)
+    finally:
+        if owns_pool:
+            await pool.close()
+    outcome = dict(zip(user_ids, results))
+
+    scanned = [profiles[user_id] for user_id, result in outcome.items() if result == 0]
+    scorer = JobScorer(profile.query for profile in scanned)
+    matches = await asyncio.to_thread(scorer.recommend, list(found_jobs.values()))
+
+    async with WriteBehindWriter() as writer:
+        for profile in scanned:
+            user_id = profile.user_id
+            for match in matches[user_id]:
+                job = match.job
+                if job.url in known[user_id]:
+                    continue
+                if profile.keyword_blacklist.match(job.title) or profile.company_blacklist.match(job.company):
+                    continue
+                await writer.add_recommended(user_id, job.title, job.company, job.url, match.matched_keyword)
+                outcome[user_id] += 1
+    for user_id, lost in writer.stats.lost_rows_by_user.items():
+        print(f"❌ {lost} recommendations for user {user_id} could not be saved")
+        outcome[user_id] -= lost
+
+    for user_id, result in outcome.items():
+        if isinstance(result, Exception):
+            print(f"❌ Scan failed for user {user_id}: {result}")
+    return outcome
+
+
+def scan_recommendations_for_users(user_ids, **kwargs):
+    return run_with_browser_pool(scan_recommendations_async, user_ids, **kwargs)
+
 
 def run_bot_for_user(user_id):
-    db = SessionLocal()
-    user = db.query(User).filter(User.id == user_id).first()
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-
-    if not profile:
-        print(f"❌ No profile found for user {user.username}")
-        return
-
-    asyncio.run(apply_to_jobs_naukri(
-        username=profile.naukri_email,
-        password=profile.naukri_password,
-        keywords=profile.keywords,
-        location=profile.preferred_locations,
-        user_id=user.id
-    ))
+    return run_bots_for_users([user_id])[user_id]
@@ -0,0 +1,109 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable, Optional
+
+from backend.core.config import settings
+
+
+@dataclass
+class ScanCacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+        }
+
+
+# What waiters get from the in-flight future when the fetch they joined failed.
+_FAILED = object()
+
+
+class ScanCache:
+    """
+    Shares search-result pages between all users on a worker.
+
+    Entries live for `ttl_seconds` and the least recently used entry is
+    evicted once `max_entries` is reached. Concurrent requests for a key that
+    is already being fetched wait for that fetch instead of starting their
+    own. A failed or cancelled fetch is never cached and its exception goes
+    only to the caller that ran it; whoever was waiting on it fetches again
+    (coalescing once more behind the first of them to get there).
+    """
+
+    def __init__(self, ttl_seconds: int = settings.SCAN_CACHE_TTL_SECONDS, max_entries: int = settings.SCAN_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = ScanCacheStats()
+        self._entries: OrderedDict = OrderedDict()
+        self._in_flight: dict = {}
+
+    def _get_fresh(self, key: Hashable):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: Hashable, value):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable]):
+        while True:
+            entry = self._get_fresh(key)
+            if entry is not None:
+                self.stats.hits += 1
+                return entry[1]
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+            self.stats.coalesced += 1
+            outcome = await asyncio.shield(in_flight)
+            if outcome is not _FAILED:
+                return outcome
+
+        self.stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await fetch()
+        except BaseException:
+            future.set_result(_FAILED)
+            raise
+        else:
+            self._store(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            del self._in_flight[key]
+
+    def clear(self):
+        self._entries.clear()
+
+
+_shared_cache: Optional[ScanCache] = None
+
+
+def get_scan_cache() -> ScanCache:
+    """Returns the process-wide scan cache shared by every user on the worker."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ScanCache()
+    return _shared_cache
@@ -1 +1,137 @@
 # Job search logic using keywords
+
+import re
+from contextlib import nullcontext
+from typing import AsyncIterator, Iterable, Optional
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from backend.core.config import settings
+from bot_engine.concurrency import goto
+from bot_engine.job_parser import JOB_CARD_SELECTOR, JobRecord, extract_jobs
+from bot_engine.readiness import wait_ready
+from bot_engine.scan_cache import get_scan_cache
+
+NO_RESULTS_SELECTOR = ".noResult, .no-result"
+
+_NON_SLUG = re.compile(r"[^a-z0-9]+")
+
+
+def split_csv(raw) -> list[str]:
+    """
+    Splits a comma-separated Profile field into trimmed, non-empty values.
+    Already-split lists and tuples are passed through the same cleanup.
+    """
+    parts = raw if isinstance(raw, (list, tuple)) else (raw or "").split(",")
+    return [part.strip() for part in parts if part and part.strip()]
+
+
+def _slugify(text: str) -> str:
+    return _NON_SLUG.sub("-", text.lower()).strip("-")
+
+
+def build_search_url(keyword: str, location: str = "", page_no: int = 1, base_url: Optional[str] = None) -> str:
+    """
+    Builds a Naukri search URL, e.g. /python-developer-jobs-in-noida-2 for
+    page 2. The location part is left out when no location is given.
+    """
+    base_url = (base_url or settings.NAUKRI_BASE_URL).rstrip("/")
+    slug = f"{_slugify(keyword)}-jobs"
+    if location:
+        slug += f"-in-{_slugify(location)}"
+    if page_no > 1:
+        slug += f"-{page_no}"
+    return f"{base_url}/{slug}"
+
+
+def scan_key(keyword: str, location: str = "", page_no: int = 1, base_url: Optional[str] = None) -> tuple:
+    """Normalized cache key, so "Python Developer" and " python  developer" share results."""
+    base_url = (base_url or settings.NAUKRI_BASE_URL).rstrip("/").lower()
+    return (base_url, _slugify(keyword), _slugify(location), page_no)
+
+
+async def fetch_search_page(page, keyword, location="", page_no=1, limiter=None, base_url=None, timer=None) -> list[JobRecord]:
+    """
+    Loads one search result page and returns its job cards. Raises
+    playwright's TimeoutError if the page never becomes ready, so a slow page
+    is not mistaken for (and cached as) an empty one.
+
+    With a `timer`, reading the cards is timed as the "parse" step (inside
+    the caller's "search" step).
+    """
+    await goto(page, build_search_url(keyword, location, page_no, base_url), limiter, wait_until="domcontentloaded")
+    await wait_ready(page, selector=f"{JOB_CARD_SELECTOR}, {NO_RESULTS_SELECTOR}")
+    async with (timer.step("parse") if timer else nullcontext()):
+        return await extract_jobs(page)
+
+
+async def scan_jobs(
+    context,
+    keywords: Iterable[str],
+    locations: Iterable[str] = (),
+    max_pages: int = settings.SCAN_MAX_PAGES,
+    seen=None,
+    limiter=None,
+    base_url=None,
+    timer=None,
+    cache=None,
+    searches=None,
+    on_seen=None,
+) -> AsyncIterator[JobRecord]:
+    """
+    Walks the search results for every keyword x location pair, page by page,
+    yielding job records as soon as each page is parsed.
+
+    `seen` is any container of job URLs already handled (e.g. applied to).
+    Search results are ordered by relevance, not date, so a seen job says
+    nothing about the jobs after it; only once a whole page holds nothing
+    but jobs seen before this scan does the scan move on to the next pair.
+    Jobs that show up under several searches are only yielded once.
+    Seen jobs are not yielded; `on_seen`, an optional async callback, is
+    awaited once with each of them instead (e.g. to report duplicates).
+
+    Result pages go through `cache` (the worker's shared ScanCache by
+    default), so users with overlapping searches fetch each page only once.
+
+    `searches` is an optional precomputed list of (keyword, location) pairs
+    (see CompiledProfile.searches) used instead of keywords x locations.
+    """
+    cache = cache or get_scan_cache()
+    seen = seen if seen is not None else set()
+    yielded = set()
+    reported = set()
+    if searches is None:
+        locations = list(locations) or [""]
+        searches = [(keyword, location) for keyword in keywords for location in locations]
+    page = await context.new_page()
+    try:
+        for keyword, location in searches:
+            for page_no in range(1, max_pages + 1):
+                try:
+                    async with (timer.step("search") if timer else nullcontext()):
+                        records = await cache.get_or_fetch(
+                            scan_key(keyword, location, page_no, base_url),
+                            lambda: fetch_search_page(page, keyword, location, page_no, limiter, base_url, timer),
+                        )
+                except PlaywrightTimeoutError:
+                    print(f"⚠️ Results for '{keyword}' in '{location}' (page {page_no}) did not load in time")
+                    break
+                if not records:
+                    break
+
+                # Checked up front: the caller may add yielded jobs to `seen`.
+                page_seen = all(record.url in seen and record.url not in yielded for record in records if record.url)
+                for record in records:
+                    if not record.url or record.url in yielded or record.url in reported:
+                        continue
+                    if record.url in seen:
+                        reported.add(record.url)
+                        if on_seen is not None:
+                            await on_seen(record)
+                        continue
+                    yielded.add(record.url)
+                    yield record
+                if page_seen:
+                    break
+    finally:
+        await page.close()
@@ -0,0 +1,181 @@
+import math
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from backend.core.config import settings
+from bot_engine.job_parser import JobRecord
+
+_TERM = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+_IMMEDIATE = re.compile(r"immediate(ly)?\s+join", re.IGNORECASE)
+
+# Profiles are scored in chunks so the (profiles x keywords x jobs) working
+# set stays small however many profiles share a scan.
+_PROFILE_CHUNK = 256
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    return [term.rstrip(".") for term in _TERM.findall((text or "").lower())]
+
+
+def _first_number(text: Optional[str]) -> Optional[float]:
+    found = _NUMBER.search(text or "")
+    return float(found.group()) if found else None
+
+
+def _salary_ceiling_lakhs(salary: str) -> Optional[float]:
+    """Upper end of a Naukri salary label such as "10-15 Lacs PA"."""
+    numbers = [float(n) for n in _NUMBER.findall(salary or "")]
+    return max(numbers) if numbers and "lac" in salary.lower() else None
+
+
+@dataclass(frozen=True)
+class ProfileQuery:
+    """The parts of a Profile the scorer uses, already parsed."""
+    user_id: int
+    keywords: tuple[str, ...]
+    locations: tuple[str, ...] = ()
+    ctc_lakhs: Optional[float] = None
+    notice_days: Optional[float] = None
+
+    @classmethod
+    def from_profile(cls, profile) -> "ProfileQuery":
+        """Built from a CompiledProfile, whose lists are already split."""
+        return cls(
+            user_id=profile.user_id,
+            keywords=tuple(k.lower() for k in profile.keywords),
+            locations=tuple(l.lower() for l in profile.locations),
+            ctc_lakhs=_first_number(profile.ctc),
+            notice_days=_first_number(profile.notice_period),
+        )
+
+
+@dataclass(frozen=True)
+class Match:
+    user_id: int
+    job: JobRecord
+    score: float
+    matched_keyword: Optional[str]
+
+
+class JobScorer:
+    """
+    Ranks jobs against many profiles at once.
+
+    The keyword side is precomputed once per set of profiles: every distinct
+    keyword phrase becomes a row of a keyword x term matrix, and each profile
+    a row of a profile x keyword membership matrix. Scoring a batch of jobs
+    then builds one TF-IDF job x term matrix and gets every profile's score
+    for every job from a few matrix products:
+
+        keyword relevance  R = K @ Jᵀ             (keywords x jobs)
+        profile score      S = max over the profile's keywords of R
+
+    and multiplies in location, salary and notice-period factors, also as
+    (profiles x jobs) arrays. `matched_keyword` is the argmax keyword among
+    the profile's own, or None when none of them matches the job at all.
+    """
+
+    def __init__(self, profiles: Iterable[ProfileQuery]):
+        self.profiles = list(profiles)
+        self.keywords = sorted({k for p in self.profiles for k in p.keywords})
+        keyword_index = {k: i for i, k in enumerate(self.keywords)}
+        self.terms = sorted({t for k in self.keywords for t in tokenize(k)})
+        self._term_index = {t: i for i, t in enumerate(self.terms)}
+
+        # Each keyword's terms weigh 1/len, so a job containing the whole
+        # phrase scores like a job containing a one-word keyword.
+        self._keyword_terms = np.zeros((len(self.keywords), len(self.terms)), dtype=np.float32)
+        for k, keyword in enumerate(self.keywords):
+            terms = tokenize(keyword)
+            for term in terms:
+                self._keyword_terms[k, self._term_index[term]] += 1 / len(terms)
+
+        self._membership = np.zeros((len(self.profiles), len(self.keywords)), dtype=bool)
+        for p, profile in enumerate(self.profiles):
+            for keyword in profile.keywords:
+                self._membership[p, keyword_index[keyword]] = True
+
+        self.locations = sorted({l for p in self.profiles for l in p.locations})
+        self._profile_locations = np.zeros((len(self.profiles), len(self.locations)), dtype=bool)
+        location_index = {l: i for i, l in enumerate(self.locations)}
+        for p, profile in enumerate(self.profiles):
+            for location in profile.locations:
+                self._profile_locations[p, location_index[location]] = True
+        self._any_location = ~self._profile_locations.any(axis=1)
+
+        self._ctc = np.array([p.ctc_lakhs if p.ctc_lakhs is not None else np.nan for p in self.profiles], dtype=np.float32)
+        self._notice = np.array([p.notice_days if p.notice_days is not None else 0 for p in self.profiles], dtype=np.float32)
+
+    def _job_term_matrix(self, jobs: list[JobRecord]) -> np.ndarray:
+        """TF-IDF over the keyword vocabulary; title terms count double."""
+        tf = np.zeros((len(jobs), len(self.terms)), dtype=np.float32)
+        for j, job in enumerate(jobs):
+            for weight, text in ((2.0, job.title), (1.0, job.company)):
+                for term in tokenize(text):
+                    t = self._term_index.get(term)
+                    if t is not None:
+                        tf[j, t] += weight
+        tf = np.log1p(tf)
+        df = (tf > 0).sum(axis=0)
+        idf = np.log((1 + len(jobs)) / (1 + df)) + 1
+        tfidf = tf * idf
+        norms = np.linalg.norm(tfidf, axis=1, keepdims=True)
+        return tfidf / np.where(norms == 0, 1, norms)
+
+    def _job_factors(self, jobs: list[JobRecord]):
+        job_locations = np.zeros((len(jobs), len(self.locations)), dtype=bool)
+        for j, job in enumerate(jobs):
+            text = job.location.lower()
+            for l, location in enumerate(self.locations):
+                job_locations[j, l] = location in text
+        ceilings = np.array([_salary_ceiling_lakhs(job.salary) or np.nan for job in jobs], dtype=np.float32)
+        immediate = np.array([bool(_IMMEDIATE.search(f"{job.title} {job.company}")) for job in jobs])
+        return job_locations, ceilings, immediate
+
+    def recommend(self, jobs: list[JobRecord], min_score: float = settings.RECOMMEND_MIN_SCORE,
+                  top_k: int = settings.RECOMMEND_TOP_K) -> dict[int, list[Match]]:
+        """Returns user_id -> up to `top_k` best matches scoring at least `min_score`."""
+        results = {p.user_id: [] for p in self.profiles}
+        if not jobs or not self.keywords:
+            return results
+
+        relevance = self._keyword_terms @ self._job_term_matrix(jobs).T  # keywords x jobs
+        job_locations, ceilings, immediate = self._job_factors(jobs)
+
+        for start in range(0, len(self.profiles), _PROFILE_CHUNK):
+            chunk = slice(start, start + _PROFILE_CHUNK)
+            # Non-member keywords get -inf so argmax can only pick one the profile owns.
+            per_keyword = np.where(self._membership[chunk][:, :, None], relevance[None, :, :], -np.inf)
+            best_keyword = per_keyword.argmax(axis=1)  # profiles x jobs
+            scores = np.maximum(per_keyword.max(axis=1), 0)
+            matched = scores > 0
+
+            # Location: the job must be in one of the profile's locations
+            # (profiles without locations accept any).
+            in_location = (self._profile_locations[chunk].astype(np.float32) @ job_locations.T.astype(np.float32)) > 0
+            scores *= np.where(in_location | self._any_location[chunk, None], 1.0, settings.RECOMMEND_OTHER_LOCATION_FACTOR)
+
+            # Salary: halve jobs whose advertised ceiling is below the expected CTC.
+            underpaid = ceilings[None, :] < self._ctc[chunk, None]  # NaN compares False
+            scores *= np.where(underpaid, 0.5, 1.0)
+
+            # Notice period: jobs asking for immediate joiners suit short notice only.
+            long_notice = self._notice[chunk, None] > settings.RECOMMEND_IMMEDIATE_NOTICE_DAYS
+            scores *= np.where(long_notice & immediate[None, :], 0.5, 1.0)
+
+            k = min(top_k, len(jobs))
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            for row, profile in enumerate(self.profiles[chunk]):
+                for j in sorted(top[row], key=lambda j: -scores[row, j]):
+                    score = float(scores[row, j])
+                    if score < min_score or math.isnan(score):
+                        continue
+                    results[profile.user_id].append(
+                        Match(profile.user_id, jobs[j], round(score, 4),
+                              self.keywords[best_keyword[row, j]] if matched[row, j] else None)
+                    )
+        return results
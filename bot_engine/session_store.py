@@ -0,0 +1,99 @@
+import base64
+import hashlib
+import json
+import os
+import time
+from typing import Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from backend.core.config import settings
+
+# Cookies that carry the Naukri login; a cached session is only worth trying
+# while at least one of them is still valid.
+AUTH_COOKIES = ("nauk_at", "nauk_rt", "nauk_sid")
+
+
+def _derive_key(secret: str) -> bytes:
+    return base64.urlsafe_b64encode(hashlib.sha256(secret.encode()).digest())
+
+
+class SessionStore:
+    """
+    Encrypted on-disk cache of Playwright `storage_state` (cookies and
+    localStorage) per Naukri account, so runs can skip the login form.
+
+    Files are named by a hash of the Naukri username and encrypted with
+    Fernet, keyed by SESSION_CACHE_KEY (or derived from SECRET_KEY). A
+    profile without a Naukri username has nothing to key on, so it is never
+    cached: `load` returns None and `save`/`invalidate` do nothing.
+    """
+
+    def __init__(self, directory: str = settings.SESSION_CACHE_DIR, key: Optional[str] = settings.SESSION_CACHE_KEY):
+        self.directory = directory
+        self._fernet = Fernet(key.encode() if key else _derive_key(settings.SECRET_KEY))
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, naukri_username: Optional[str]) -> Optional[str]:
+        if not naukri_username or not naukri_username.strip():
+            return None
+        digest = hashlib.sha256(naukri_username.strip().lower().encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.session")
+
+    def load(self, naukri_username: Optional[str]) -> Optional[dict]:
+        """Returns the cached storage_state if present and not expired, else None."""
+        path = self._path(naukri_username)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                state = json.loads(self._fernet.decrypt(f.read()))
+        except (OSError, InvalidToken, ValueError):
+            return None
+        if not is_fresh(state):
+            self.invalidate(naukri_username)
+            return None
+        return state
+
+    def save(self, naukri_username: Optional[str], state: dict):
+        path = self._path(naukri_username)
+        if path is None:
+            return
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._fernet.encrypt(json.dumps(state).encode()))
+        os.replace(tmp_path, path)
+
+    def invalidate(self, naukri_username: Optional[str]):
+        path = self._path(naukri_username)
+        if path is None:
+            return
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def is_fresh(state: dict, margin_seconds: int = 300) -> bool:
+    """
+    Cheap offline validity check: the session is usable while an auth cookie
+    has not expired (with a safety margin). Session cookies (expires == -1)
+    count as valid; the live check after navigation catches the rest.
+    """
+    now = time.time() + margin_seconds
+    for cookie in state.get("cookies", []):
+        if cookie.get("name") in AUTH_COOKIES:
+            expires = cookie.get("expires", -1)
+            if expires == -1 or expires > now:
+                return True
+    return False
+
+
+_shared_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    global _shared_store
+    if _shared_store is None:
+        _shared_store = SessionStore()
+    return _shared_store
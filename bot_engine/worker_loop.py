@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from typing import Optional
+
+from bot_engine.browser_pool import close_browser_pool, get_browser_pool
+
+# How long shutdown waits for the browsers to close before giving up.
+_SHUTDOWN_TIMEOUT_SECONDS = 30
+
+
+class WorkerLoop:
+    """
+    One event loop per worker process, running on a daemon thread for the
+    life of the process, with the process's BrowserPool living on it.
+
+    Celery tasks are synchronous; they hand their coroutine to this loop and
+    block until it is done, so every task the process runs reuses the same
+    warm browsers (and the same scan cache) instead of starting an event
+    loop and a Chromium of its own.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="bot-event-loop", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def run(self, coro):
+        """
+        Runs `coro` on the loop and returns its result. If the calling thread
+        is interrupted (e.g. Celery's soft time limit), the coroutine is
+        cancelled before the exception propagates.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self):
+        try:
+            asyncio.run_coroutine_threadsafe(close_browser_pool(), self.loop).result(_SHUTDOWN_TIMEOUT_SECONDS)
+        except Exception as e:
+            print(f"WARNING: Browser pool did not close cleanly: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(_SHUTDOWN_TIMEOUT_SECONDS)
+
+
+_worker_loop: Optional[WorkerLoop] = None
+
+
+def start_worker_loop():
+    """Starts this process's loop (call from worker_process_init)."""
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = WorkerLoop()
+        _worker_loop.start()
+
+
+def stop_worker_loop():
+    """Closes the browser pool and stops the loop (call from worker_process_shutdown)."""
+    global _worker_loop
+    if _worker_loop is not None:
+        _worker_loop.stop()
+        _worker_loop = None
+
+
+async def _with_shared_pool(run, args, kwargs):
+    kwargs.setdefault("pool", get_browser_pool())
+    return await run(*args, **kwargs)
+
+
+def run_with_browser_pool(run, *args, **kwargs):
+    """
+    Calls the coroutine function `run(*args, pool=..., **kwargs)` to
+    completion. In a worker process it runs on the persistent loop with the
+    process's shared BrowserPool; anywhere else (scripts, eager mode) it
+    gets an event loop and a pool of its own for this call.
+    """
+    if _worker_loop is None:
+        return asyncio.run(run(*args, **kwargs))
+    return _worker_loop.run(_with_shared_pool(run, args, kwargs))
@@ -1,17 +1,45 @@
-from backend.db.models import AppliedJob
+from sqlalchemy.exc import IntegrityError
+
+from backend.db.models import AppliedJob, RecommendedJob
 from backend.db.database import SessionLocal
 
+
+def get_applied_links(user_id):
+    """Returns the set of job links the user has already applied to."""
+    db = SessionLocal()
+    try:
+        rows = db.query(AppliedJob.job_link).filter(AppliedJob.user_id == user_id).all()
+        return {job_link for (job_link,) in rows if job_link}
+    finally:
+        db.close()
+
+
+def get_recommended_links(user_id):
+    """Returns the set of job links already recommended to the user."""
+    db = SessionLocal()
+    try:
+        rows = db.query(RecommendedJob.job_link).filter(RecommendedJob.user_id == user_id).all()
+        return {job_link for (job_link,) in rows if job_link}
+    finally:
+        db.close()
+
+
 def log_applied_job(user_id, job_title, company, url):
+    """
+    Records an application. Duplicates are rejected by the unique
+    (user_id, job_link) index rather than a lookup query first.
+    """
     db = SessionLocal()
-    exists = db.query(AppliedJob).filter_by(user_id=user_id, job_url=url).first()
-    if exists:
-        return  # Already applied, skip
-    job = AppliedJob(
-        user_id=user_id,
-        job_title=job_title,
-        company_name=company,
-        job_url=url
-    )
-    db.add(job)
-    db.commit()
-    db.close()
+    try:
+        job = AppliedJob(
+            user_id=user_id,
+            job_title=job_title,
+            company_name=company,
+            job_link=url
+        )
+        db.add(job)
+        db.commit()
+    except IntegrityError:
+        db.rollback()  # Already applied, skip
+    finally:
+        db.close()
@@ -40,18 +40,10 @@ echo "🧠 Installing Playwright browser..."
 playwright install
 echo "✅ Playwright setup complete."
 
-# Ensure migrations directory exists before running alembic
-echo "📁 Checking for migrations directory..."
-if [ ! -d "backend/db/migrations" ]; then
-    echo "Directory not found. Creating backend/db/migrations..."
-    mkdir -p backend/db/migrations
-fi
-echo "✅ Migrations directory check complete."
-
-
-# Database migrations
+# Database migrations (the API does not create tables itself)
 echo "🔧 Running database migrations..."
-alembic upgrade head
+python -m backend.db.migrate
+python -m backend.db.migrate --check || exit 1
 echo "✅ Database is up to date."
 
 # Frontend setup
@@ -64,7 +56,7 @@ echo "🚀 Starting all services..."
 
 # Start Celery worker in a new terminal or as a background process
 echo "Starting Celery worker..."
-celery -A backend.core.celery_app worker --loglevel=info &
+celery -A backend.core.celery_app worker -B -Q celery,scan --loglevel=info &
 CELERY_PID=$!
 sleep 5 # Give celery a moment to start up
 
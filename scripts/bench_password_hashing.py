@@ -0,0 +1,43 @@
+# Micro-benchmark for login cost: how many password verifications per second
+# the dedicated hashing pool sustains, overall and per core.
+#
+#   SECRET_KEY=dev python -m scripts.bench_password_hashing [logins] [rounds]
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.auth import password_utils
+from backend.core.config import settings
+
+
+def main():
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else settings.BCRYPT_ROUNDS
+    context = password_utils.pwd_context.copy(
+        bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds, bcrypt__max_rounds=rounds
+    )
+    password_utils.pwd_context = context
+    stored_hash = context.hash("correct horse battery staple")
+
+    workers = password_utils._workers
+    cores = os.cpu_count() or 1
+    # Enough callers to keep the pool saturated without tripping the queue limit.
+    with ThreadPoolExecutor(max_workers=workers) as callers:
+        start = time.perf_counter()
+        results = list(callers.map(
+            lambda _: password_utils.verify_password("correct horse battery staple", stored_hash),
+            range(logins),
+        ))
+        elapsed = time.perf_counter() - start
+
+    assert all(results)
+    rate = logins / elapsed
+    print(f"🔑 bcrypt cost {rounds}: {logins} logins in {elapsed:.2f}s on {workers} hashing threads")
+    print(f"   {rate:.1f} logins/sec total, {rate / min(workers, cores):.1f} logins/sec per core")
+    print(f"   {1000 * elapsed * workers / logins:.0f} ms CPU per login")
+
+
+if __name__ == "__main__":
+    main()
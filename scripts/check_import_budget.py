@@ -0,0 +1,84 @@
+# Start-up import budget for the API process.
+#
+# Imports the app in a fresh interpreter with `python -X importtime`, prints
+# the slowest modules and fails (exit 1) when a module the API must not load
+# eagerly shows up. tests/test_import_budget.py runs the same check.
+#
+# Import time is too noisy for a hard limit (the same tree measures
+# 1.5-1.7 s from run to run), so the total is the median of a few runs and
+# going over --budget-ms only prints a warning. The default budget is the
+# measured median (~1.64 s) plus a 25% margin:
+#
+#   python -m scripts.check_import_budget
+#   python -m scripts.check_import_budget --runs 9 --budget-ms 1800 --top 30
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+# Packages only the Celery worker or the bot needs.
+FORBIDDEN_PREFIXES = ("celery", "kombu", "playwright", "bot_engine", "backend.tasks", "numpy", "jinja2")
+
+# "import time: self [us] | cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def profile_imports(module: str) -> list[tuple[str, int, int, int]]:
+    """Returns (module, self_us, cumulative_us, depth) for every import of `module`."""
+    env = dict(os.environ)
+    env.setdefault("SECRET_KEY", "import-budget-check")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, cwd=_REPO_ROOT,
+    )
+    if proc.returncode != 0:
+        sys.exit(f"Importing {module} failed:\n{proc.stderr}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        found = _LINE.match(line)
+        if found:
+            self_us, cumulative_us, indent, name = found.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def forbidden_imports(rows) -> list[str]:
+    """Modules in `rows` that only the worker or the bot should load."""
+    return sorted({name for name, *_ in rows if name.startswith(FORBIDDEN_PREFIXES)})
+
+
+def total_ms(rows) -> float:
+    return sum(self_us for _, self_us, _, _ in rows) / 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the API's import-time budget.")
+    parser.add_argument("--module", default="backend.main")
+    parser.add_argument("--budget-ms", type=float, default=2050.0, help="warn when the median total exceeds this")
+    parser.add_argument("--runs", type=int, default=5, help="imports to time; the median total is reported")
+    parser.add_argument("--top", type=int, default=15, help="how many of the slowest imports to list")
+    args = parser.parse_args(argv)
+
+    profiles = [profile_imports(args.module) for _ in range(max(args.runs, 1))]
+    median_ms = statistics.median(total_ms(rows) for rows in profiles)
+    rows = profiles[-1]
+    print(f"{args.module}: {len(rows)} modules imported in {median_ms:.0f} ms "
+          f"(median of {len(profiles)}, budget {args.budget_ms:.0f} ms)")
+    for name, _, cumulative_us, _ in sorted(rows, key=lambda row: -row[2])[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    if median_ms > args.budget_ms:
+        print(f"WARNING: over budget by {median_ms - args.budget_ms:.0f} ms")
+    forbidden = forbidden_imports(rows)
+    if forbidden:
+        print("Imported at start-up but only needed by workers:", ", ".join(forbidden))
+    sys.exit(1 if forbidden else 0)
+
+
+if __name__ == "__main__":
+    main()
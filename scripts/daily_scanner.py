@@ -1 +1,26 @@
 # Scheduled job scanner
+#
+# The scan normally runs from Celery beat (backend/tasks/daily_scan.py).
+# This script triggers it by hand:
+#
+#   python -m scripts.daily_scanner            # enqueue the fan-out now
+#   python -m scripts.daily_scanner 1 2 3      # scan these users inline
+
+import sys
+
+
+def main():
+    user_ids = [int(arg) for arg in sys.argv[1:]]
+    if user_ids:
+        from bot_engine.run_for_user import scan_recommendations_for_users
+
+        print(scan_recommendations_for_users(user_ids))
+    else:
+        from backend.core.task_client import SCHEDULE_DAILY_SCAN_TASK, send_task
+
+        result = send_task(SCHEDULE_DAILY_SCAN_TASK)
+        print(f"Daily scan fan-out enqueued: {result.id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,11 @@
 # Send weekly report
+#
+# The report normally goes out from Celery beat every Monday. This script
+# sends it right away, inline:
+#
+#   python -m scripts.email_reporter
+
+from backend.tasks.weekly_report import send_weekly_report
+
+if __name__ == "__main__":
+    print(send_weekly_report())
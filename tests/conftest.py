@@ -0,0 +1,4 @@
+import os
+
+# Settings refuse to load without a secret; tests never sign real tokens.
+os.environ.setdefault("SECRET_KEY", "test")
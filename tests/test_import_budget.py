@@ -0,0 +1,8 @@
+from scripts.check_import_budget import forbidden_imports, profile_imports
+
+
+def test_api_does_not_import_worker_modules():
+    rows = profile_imports("backend.main")
+
+    assert rows, "python -X importtime produced no output"
+    assert forbidden_imports(rows) == []
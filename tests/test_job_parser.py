@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from bench.fake_naukri import search_page_html
+from bot_engine.job_parser import parse_jobs_html
+
+FIXTURES = Path(__file__).resolve().parents[1] / "bench" / "fixtures"
+
+
+def test_parses_every_card_of_a_result_page():
+    records = parse_jobs_html(search_page_html("python-developer", "noida", 1, 20), "http://naukri.test")
+    assert len(records) == 20
+    assert records[0].url == "http://naukri.test/job-listings-python-developer-noida-1-0"
+    assert records[0].company == "Company 0"
+    assert records[0].can_apply
+
+
+def test_unclosed_tags_inside_cards():
+    records = parse_jobs_html((FIXTURES / "unclosed_tags.html").read_text(encoding="utf-8"))
+    assert [record.job_id for record in records] == ["111", "222", "333"]
+    assert records[0].location == "Noida"
+    assert records[0].salary == "10-15 Lacs PA"
+    assert records[1].posted == "2 Days Ago"
+
+
+def test_truncated_page_keeps_the_open_card():
+    html = search_page_html("data-engineer", "", 1, 3)
+    truncated = html[:html.rindex("</article>")]
+    records = parse_jobs_html(truncated)
+    assert len(records) == 3
+    assert records[-1].title == "Data Engineer 1.2"
+    assert records[-1].company == "Company 2"
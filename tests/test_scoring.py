@@ -0,0 +1,16 @@
+from bot_engine.job_parser import JobRecord
+from bot_engine.scoring import JobScorer, ProfileQuery
+
+
+def test_matched_keyword_is_one_the_profile_owns():
+    # "aardvark" sorts first, so a zero-filled argmax would have picked it.
+    scorer = JobScorer([
+        ProfileQuery(1, ("aardvark",)),
+        ProfileQuery(2, ("python developer", "zookeeper")),
+    ])
+    jobs = [JobRecord("Senior Zookeeper", "Acme", "https://example.com/1")]
+
+    matches = scorer.recommend(jobs, min_score=0.0)
+
+    assert [m.matched_keyword for m in matches[2]] == ["zookeeper"]
+    assert [m.matched_keyword for m in matches[1]] == [None]